@@ -5,146 +5,364 @@ Main Flask application with REST API endpoints
 """
 
 import os
-import json
+import re
+import atexit
+import logging
+import logging.handlers
+import secrets
+import shutil
 import threading
 import queue
 import tempfile
-import wave
+import uuid
 import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 import numpy as np
-import sounddevice as sd
-import requests
 from flask import Flask, render_template, request, jsonify, Response
 from flask_cors import CORS
+from dotenv import load_dotenv
 from werkzeug.utils import secure_filename
 
 # Import our services
 from services.audio_service import AudioService
 from services.dictionary_service import DictionaryService
+from services.json_utils import dumps_json
 from services.transcription_service import TranscriptionService
-from services.background_service import BackgroundService
+
+@dataclass(frozen=True)
+class Config:
+    """Environment-derived settings, resolved once at import"""
+    debug: bool
+    port: int
+    secret_key: str
+
+# Load environment variables before anything reads them
+load_dotenv()
+CFG = Config(
+    debug=os.environ.get('FLASK_DEBUG', 'False').lower() == 'true',
+    port=int(os.environ.get('PORT', 5000)),
+    secret_key=os.environ.get('SECRET_KEY', 'dev-secret-key')
+)
 
 app = Flask(__name__)
 CORS(app)
 
 # Configuration
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
+app.config['SECRET_KEY'] = CFG.secret_key
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['TEMP_FOLDER'] = 'temp'
+app.json.compact = True
 
 # Create upload directories
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['TEMP_FOLDER'], exist_ok=True)
 
+def json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response without going through jsonify"""
+    return Response(dumps_json(obj), status=status, mimetype='application/json')
+
+# Transcription worker logging goes through a queue so the hot path never
+# blocks on stdout; a listener thread does the actual writes
+log = logging.getLogger('transcription')
+log.setLevel(logging.INFO)
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(log_queue))
+log.propagate = False
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+atexit.register(log_listener.stop)
+
 # Initialize services
 audio_service = AudioService()
 dictionary_service = DictionaryService()
 transcription_service = TranscriptionService()
-background_service = BackgroundService(audio_service, transcription_service)
 
 # Global state for active sessions
 active_sessions: Dict[str, Dict[str, Any]] = {}
 
-# Background processing thread
-def process_audio_transcriptions():
-    """Background thread to process audio and generate transcriptions"""
-    while True:
+# Uploaded files are transcribed off the request thread; each job reports
+# progress through its own queue until a final message with 'done' set
+UPLOAD_WORKERS = 2
+upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
+upload_jobs: Dict[str, queue.Queue] = {}
+
+# Uploads are spooled in memory up to the request size limit, so they normally never
+# touch disk; a larger spool rolls over to an anonymous file that closing removes
+UPLOAD_SPOOL_SIZE = app.config['MAX_CONTENT_LENGTH']
+
+# Finished jobs whose progress stream was never read are dropped after this long
+UPLOAD_JOB_TTL = 10 * 60  # seconds
+upload_jobs_finished: Dict[str, float] = {}
+
+def sweep_upload_jobs():
+    """Forget finished jobs nobody collected within UPLOAD_JOB_TTL"""
+    cutoff = time.time() - UPLOAD_JOB_TTL
+    for job_id, finished_at in list(upload_jobs_finished.items()):
+        if finished_at < cutoff:
+            upload_jobs.pop(job_id, None)
+            upload_jobs_finished.pop(job_id, None)
+
+# Serialized dictionary lookups keyed by lowercased word: word -> (expires_at, json)
+DEFINITION_CACHE_SIZE = 10000
+DEFINITION_CACHE_TTL = 24 * 60 * 60  # seconds
+definition_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+definition_cache_lock = threading.Lock()
+
+# Client-supplied session IDs are restricted to URL-safe characters
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+# Completed sentences kept per session. Only the newest TRANSCRIPTION_RING_SIZE
+# are retained: older ones are overwritten and drop out of GET /api/transcriptions
+TRANSCRIPTION_RING_SIZE = 1024
+
+# Seconds between SSE heartbeats so idle proxies keep the stream open
+SSE_KEEPALIVE_INTERVAL = 15
+
+# Undelivered updates a single SSE subscriber may hold; one that falls further
+# behind is disconnected and catches up from the replay log when it reconnects
+SSE_SUBSCRIBER_QUEUE_SIZE = 64
+
+# Recent updates kept per session for clients reconnecting with Last-Event-ID
+SSE_REPLAY_SIZE = 256
+
+def append_transcription(session: Dict[str, Any], entry: Dict[str, Any]):
+    """Store a completed sentence in the session's ring, overwriting the oldest when full"""
+    # The transcription worker and the POST route both append; the lock keeps their
+    # read-modify-write of the tail from claiming the same slot
+    with session['transcriptions_lock']:
+        # Fill the slot before publishing the new tail so readers never see a stale entry
+        tail = session['transcription_tail']
+        session['transcriptions'][tail % TRANSCRIPTION_RING_SIZE] = entry
+        session['transcription_tail'] = tail + 1
+
+def snapshot_transcriptions(session: Dict[str, Any]) -> list:
+    """Copy the completed sentences currently held in the session's ring"""
+    ring = session['transcriptions']
+    tail = session['transcription_tail']
+    head = max(0, tail - TRANSCRIPTION_RING_SIZE)
+    return [ring[i % TRANSCRIPTION_RING_SIZE] for i in range(head, tail)]
+
+def publish_transcription(session: Dict[str, Any], text: str, complete: bool):
+    """Number a transcription update, log it for replay and fan it out to SSE subscribers"""
+    message = dumps_json({'text': text, 'complete': complete})
+    with session['sse_lock']:
+        session['sse_last_id'] += 1
+        event = (session['sse_last_id'], message)
+        session['sse_replay'].append(event)
+        for subscriber in list(session['sse_subscribers']):
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # Too far behind (or a dead socket); drop it rather than buffer forever
+                session['sse_subscribers'].discard(subscriber)
+
+def subscribe_transcriptions(session: Dict[str, Any], last_id: int) -> tuple:
+    """Register a new SSE subscriber; returns its queue and the logged updates after last_id"""
+    subscriber = queue.Queue(maxsize=SSE_SUBSCRIBER_QUEUE_SIZE)
+    with session['sse_lock']:
+        missed = [event for event in session['sse_replay'] if event[0] > last_id]
+        session['sse_subscribers'].add(subscriber)
+    return subscriber, missed
+
+def unsubscribe_transcriptions(session: Dict[str, Any], subscriber: queue.Queue):
+    """Remove an SSE subscriber once its stream ends"""
+    with session['sse_lock']:
+        session['sse_subscribers'].discard(subscriber)
+
+def format_sse_event(event: tuple) -> bytes:
+    """Frame an (id, JSON message) update as a server-sent event"""
+    event_id, message = event
+    return b"id: %d\ndata: %s\n\n" % (event_id, message)
+
+# Characters of the previous transcript passed to Whisper as a prompt for the next chunk
+WHISPER_PROMPT_CHARS = 200
+
+# Chunks already waiting when the worker wakes are transcribed together, so a
+# backlog costs one Whisper request per session instead of one per chunk
+MAX_BATCH_CHUNKS = 4
+
+def collect_chunks(first: tuple) -> tuple:
+    """Drain up to MAX_BATCH_CHUNKS queued chunks; also report a pending shutdown"""
+    items = [first]
+    while len(items) < MAX_BATCH_CHUNKS:
         try:
-            # Check all active sessions for audio data
-            for session_id in list(active_sessions.keys()):
-                if session_id in audio_service.audio_queues:
-                    audio_queue = audio_service.audio_queues[session_id]
-                    
-                    try:
-                        # Get audio data from queue (with timeout)
-                        audio_data = audio_queue.get(timeout=1.0)
-                        
-                        if audio_data['type'] == 'audio_chunk':
-                            print(f"Processing audio chunk for session {session_id}")
-                            # Transcribe the audio
-                            result = transcription_service.transcribe_audio_data(
-                                audio_data['data'],
-                                audio_data['sample_rate']
-                            )
-                            
-                            print(f"Transcription result: {result}")
-                            
-                            if result['success'] and result['text'].strip():
-                                print(f"Got transcription text: {result['text']}")
-                                # Process the transcription
-                                processed = transcription_service.process_transcription(result['text'])
-                                
-                                print(f"Processed transcription: {processed}")
-                                
-                                if processed['success']:
-                                    # Send complete sentences to the session
-                                    for sentence in processed['complete_sentences']:
-                                        if session_id in active_sessions:
-                                            active_sessions[session_id]['transcriptions'].append({
-                                                'text': sentence,
-                                                'timestamp': datetime.now().isoformat(),
-                                                'complete': True
-                                            })
-                                            print(f"Added complete sentence: {sentence}")
-                                    
-                                    # Update current sentence if it exists
-                                    if processed['current_sentence']:
-                                        if session_id in active_sessions:
-                                            active_sessions[session_id]['current_sentence'] = processed['current_sentence']
-                                            print(f"Updated current sentence: {processed['current_sentence']}")
-                            else:
-                                print(f"Transcription failed or empty: {result}")
-                        
-                        audio_queue.task_done()
-                        
-                    except queue.Empty:
-                        # No audio data available, continue
-                        continue
-                    except Exception as e:
-                        print(f"Error processing audio for session {session_id}: {e}")
-                        break
+            item = audio_service.chunk_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is None:
+            return items, True
+        items.append(item)
+    return items, False
+
+def merge_session_chunks(items: list) -> list:
+    """Join each session's chunks into one clip"""
+    merged: Dict[str, tuple] = {}
+    for session_id, data, sample_rate in items:
+        if session_id in merged:
+            merged[session_id][1].append(data)
+        else:
+            merged[session_id] = (sample_rate, [data])
+    
+    return [
+        (session_id, sample_rate, buffers[0] if len(buffers) == 1 else np.concatenate(buffers), buffers)
+        for session_id, (sample_rate, buffers) in merged.items()
+    ]
+
+def transcribe_session_audio(session_id: str, data: np.ndarray, sample_rate: int):
+    """Transcribe one clip and deliver its sentences to the session"""
+    log.debug("Processing audio chunk for session %s", session_id)
+    # Transcribe the audio, priming Whisper with the end of the previous text in
+    # place of re-sending the previous chunk's audio
+    session = active_sessions.get(session_id)
+    prompt = session['last_text'][-WHISPER_PROMPT_CHARS:] if session else ''
+    result = transcription_service.transcribe_audio_data(data, sample_rate, prompt=prompt)
+    
+    log.debug("Transcription result: %s", result)
+    
+    if result['success'] and result['text'].strip():
+        log.debug("Got transcription text: %s", result['text'])
+        if session:
+            session['last_text'] = result['text'].strip()
+        # Process the transcription
+        processed = transcription_service.process_transcription(result['text'])
+        
+        log.debug("Processed transcription: %s", processed)
+        
+        if processed['success']:
+            # All sentences from one chunk share its timestamp
+            timestamp = datetime.now().isoformat()
             
-            time.sleep(0.1)  # Small delay to prevent busy waiting
+            # Send complete sentences to the session
+            for sentence in processed['complete_sentences']:
+                if session_id in active_sessions:
+                    session = active_sessions[session_id]
+                    append_transcription(session, {
+                        'text': sentence,
+                        'timestamp': timestamp,
+                        'complete': True
+                    })
+                    publish_transcription(session, sentence, complete=True)
+                    log.info("Added complete sentence: %s", sentence)
             
-        except Exception as e:
-            print(f"Error in transcription processing loop: {e}")
-            time.sleep(1)
+            # Update current sentence if it exists
+            if processed['current_sentence']:
+                if session_id in active_sessions:
+                    session = active_sessions[session_id]
+                    session['current_sentence'] = processed['current_sentence']
+                    publish_transcription(session, processed['current_sentence'], complete=False)
+                    log.debug("Updated current sentence: %s", processed['current_sentence'])
+    else:
+        log.info("Transcription failed or empty: %s", result.get('error'))
+
+def transcribe_clip(session_id: str, sample_rate: int, data: np.ndarray, buffers: list):
+    """Transcribe one merged clip, then return its chunk buffers to the pool"""
+    try:
+        if session_id not in active_sessions:
+            return
+        # Chunks with no voiced frame never reach Whisper
+        if not audio_service.has_speech(data):
+            log.debug("No speech in chunk for session %s, skipping transcription", session_id)
+            return
+        transcribe_session_audio(session_id, data, sample_rate)
+    except Exception as e:
+        log.error("Error processing audio for session %s: %s", session_id, e)
+    finally:
+        for buffer in buffers:
+            audio_service.chunk_pool.release(buffer)
+
+# Whisper requests for different sessions in the same batch run side by side; a
+# batch holds at most one clip per session, so each session stays in order
+TRANSCRIPTION_WORKERS = 4
+transcription_executor = ThreadPoolExecutor(max_workers=TRANSCRIPTION_WORKERS)
+
+# Background processing thread
+def process_audio_transcriptions():
+    """Background thread to process audio and generate transcriptions"""
+    shutting_down = False
+    while not shutting_down:
+        # Block until the audio service hands over a chunk from any session
+        item = audio_service.chunk_queue.get()
+        if item is None:
+            break
+        
+        items, shutting_down = collect_chunks(item)
+        clips = merge_session_chunks(items)
+        if len(clips) == 1:
+            transcribe_clip(*clips[0])
+        else:
+            # Wait for the whole batch before taking the next one
+            list(transcription_executor.map(lambda clip: transcribe_clip(*clip), clips))
 
 # Start background processing thread
 transcription_thread = threading.Thread(target=process_audio_transcriptions, daemon=True)
 transcription_thread.start()
+atexit.register(audio_service.shutdown)
+atexit.register(dictionary_service.close)
+atexit.register(transcription_service.close)
 
 @app.route('/')
 def index():
     """Serve the main application page"""
     return render_template('index.html')
 
+# The icon never changes while the app runs; read it once and let clients keep it
+with open(os.path.join(app.static_folder, 'favicon.ico'), 'rb') as icon_file:
+    FAVICON_BYTES = icon_file.read()
+
+def icon_response() -> Response:
+    """Serve the cached icon bytes with a long-lived cache header"""
+    return Response(FAVICON_BYTES, mimetype='image/x-icon', headers={
+        'Cache-Control': 'public, max-age=31536000, immutable'
+    })
+
 @app.route('/favicon.ico')
 def favicon():
     """Serve favicon"""
-    return app.send_static_file('favicon.ico')
+    return icon_response()
 
 @app.route('/apple-touch-icon.png')
 @app.route('/apple-touch-icon-precomposed.png')
 def apple_touch_icon():
     """Serve apple touch icon"""
-    return app.send_static_file('favicon.ico')
+    return icon_response()
 
 @app.route('/api/start-recording', methods=['POST'])
 def start_recording():
     """Start audio recording session"""
-    session_id = request.json.get('session_id', f'session_{int(time.time())}')
+    if not request.is_json:
+        return jsonify({
+            'success': False,
+            'error': 'Expected a JSON request body'
+        }), 415
+    
+    data = request.get_json(silent=True, cache=False) or {}
+    session_id = data.get('session_id') or secrets.token_urlsafe(12)
+    
+    if not isinstance(session_id, str) or not SESSION_ID_PATTERN.match(session_id):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid session ID'
+        }), 400
     
     try:
         # Initialize session
         active_sessions[session_id] = {
             'is_recording': True,
-            'transcriptions': [],
+            'transcriptions': [None] * TRANSCRIPTION_RING_SIZE,
+            'transcription_tail': 0,
+            'transcriptions_lock': threading.Lock(),
             'current_sentence': '',
+            'last_text': '',
+            'sse_lock': threading.Lock(),
+            'sse_subscribers': set(),
+            'sse_replay': deque(maxlen=SSE_REPLAY_SIZE),
+            'sse_last_id': 0,
             'start_time': datetime.now().isoformat()
         }
         
@@ -165,9 +383,16 @@ def start_recording():
 @app.route('/api/stop-recording', methods=['POST'])
 def stop_recording():
     """Stop audio recording session"""
-    session_id = request.json.get('session_id')
+    if not request.is_json:
+        return jsonify({
+            'success': False,
+            'error': 'Expected a JSON request body'
+        }), 415
     
-    if not session_id or session_id not in active_sessions:
+    data = request.get_json(silent=True, cache=False) or {}
+    session_id = data.get('session_id')
+    
+    if not isinstance(session_id, str) or session_id not in active_sessions:
         return jsonify({
             'success': False,
             'error': 'Invalid session ID'
@@ -201,13 +426,50 @@ def get_transcriptions(session_id):
         }), 404
     
     session = active_sessions[session_id]
-    return jsonify({
+    return json_response({
         'success': True,
-        'transcriptions': session['transcriptions'],
+        'transcriptions': snapshot_transcriptions(session),
         'current_sentence': session['current_sentence'],
         'is_recording': session['is_recording']
     })
 
+@app.route('/api/stream/<session_id>')
+def stream_transcriptions(session_id):
+    """Stream transcriptions for a session as server-sent events"""
+    if session_id not in active_sessions:
+        return jsonify({
+            'success': False,
+            'error': 'Session not found'
+        }), 404
+    
+    session = active_sessions[session_id]
+    
+    # EventSource resends the last id it saw when it reconnects
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    last_id = int(last_event_id) if last_event_id.isdigit() else 0
+    
+    def generate():
+        subscriber, missed = subscribe_transcriptions(session, last_id)
+        try:
+            for event in missed:
+                yield format_sse_event(event)
+            while session_id in active_sessions:
+                try:
+                    event = subscriber.get(timeout=SSE_KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    if subscriber not in session['sse_subscribers']:
+                        break  # Dropped for falling behind; the client reconnects
+                    yield b": keepalive\n\n"
+                    continue
+                yield format_sse_event(event)
+        finally:
+            unsubscribe_transcriptions(session, subscriber)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/api/transcriptions/<session_id>', methods=['POST'])
 def add_transcription(session_id):
     """Add a new transcription to a session"""
@@ -217,7 +479,13 @@ def add_transcription(session_id):
             'error': 'Session not found'
         }), 404
     
-    data = request.json
+    if not request.is_json:
+        return jsonify({
+            'success': False,
+            'error': 'Expected a JSON request body'
+        }), 415
+    
+    data = request.get_json(silent=True, cache=False) or {}
     transcription_text = data.get('text', '').strip()
     is_complete = data.get('complete', False)
     
@@ -232,7 +500,7 @@ def add_transcription(session_id):
         
         if is_complete:
             # Add as completed sentence
-            session['transcriptions'].append({
+            append_transcription(session, {
                 'text': transcription_text,
                 'timestamp': datetime.now().isoformat(),
                 'complete': True
@@ -242,6 +510,8 @@ def add_transcription(session_id):
             # Update current sentence
             session['current_sentence'] = transcription_text
         
+        publish_transcription(session, transcription_text, complete=is_complete)
+        
         return jsonify({
             'success': True,
             'message': 'Transcription added'
@@ -252,25 +522,60 @@ def add_transcription(session_id):
             'error': str(e)
         }), 500
 
+def get_cached_definition(word: str) -> bytes:
+    """Return the JSON-encoded definition for a word, looking it up on a cache miss"""
+    key = word.strip().lower()
+    now = time.time()
+    
+    with definition_cache_lock:
+        cached = definition_cache.get(key)
+        if cached and cached[0] > now:
+            definition_cache.move_to_end(key)
+            return cached[1]
+    
+    definition = dictionary_service.get_definition(key)
+    body = dumps_json(definition)
+    
+    # Don't pin failed or placeholder lookups for a whole day
+    if definition.get('success') and not definition.get('fallback'):
+        with definition_cache_lock:
+            definition_cache[key] = (now + DEFINITION_CACHE_TTL, body)
+            definition_cache.move_to_end(key)
+            if len(definition_cache) > DEFINITION_CACHE_SIZE:
+                definition_cache.popitem(last=False)
+    
+    return body
+
 @app.route('/api/dictionary/<word>')
 def get_word_definition(word):
     """Get word definition from dictionary service"""
     try:
-        definition = dictionary_service.get_definition(word)
-        return jsonify({
-            'success': True,
-            'word': word,
-            'definition': definition
-        })
+        definition = get_cached_definition(word)
+        body = b'{"success": true, "word": ' + dumps_json(word) + b', "definition": ' + definition + b'}'
+        return Response(body, mimetype='application/json')
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+def run_upload_job(job_id: str, audio_file, filename: str):
+    """Transcribe an uploaded file and report progress to the job's queue"""
+    progress = upload_jobs[job_id]
+    try:
+        progress.put({'stage': 'transcribing', 'pct': 50})
+        transcription = transcription_service.transcribe_fileobj(audio_file, filename)
+        progress.put({'done': True, 'success': True, 'transcription': transcription})
+    except Exception as e:
+        progress.put({'done': True, 'success': False, 'error': str(e)})
+    finally:
+        # Closing the spool frees its memory or deletes its rolled-over file
+        audio_file.close()
+        upload_jobs_finished[job_id] = time.time()
+
 @app.route('/api/upload-audio', methods=['POST'])
 def upload_audio():
-    """Upload audio file for transcription"""
+    """Upload audio file and queue it for transcription"""
     if 'audio' not in request.files:
         return jsonify({
             'success': False,
@@ -284,32 +589,66 @@ def upload_audio():
             'error': 'No file selected'
         }), 400
     
+    audio_file = tempfile.SpooledTemporaryFile(
+        max_size=UPLOAD_SPOOL_SIZE,
+        dir=app.config['TEMP_FOLDER']
+    )
     try:
-        # Save uploaded file
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Transcribe the audio
-        transcription = transcription_service.transcribe_file(filepath)
+        # Copy the upload in 1MB pieces; the name only tells Whisper the format
+        filename = secure_filename(file.filename) or 'audio.wav'
+        shutil.copyfileobj(file.stream, audio_file, length=1 << 20)
         
-        # Clean up uploaded file
-        os.remove(filepath)
+        sweep_upload_jobs()
+        job_id = uuid.uuid4().hex
+        upload_jobs[job_id] = queue.Queue()
+        upload_jobs[job_id].put({'stage': 'uploaded', 'pct': 10})
+        upload_executor.submit(run_upload_job, job_id, audio_file, filename)
         
         return jsonify({
             'success': True,
-            'transcription': transcription
-        })
+            'job_id': job_id
+        }), 202
     except Exception as e:
+        # The job never started, so nothing else will close the file
+        audio_file.close()
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@app.route('/api/progress/<job_id>')
+def upload_progress(job_id):
+    """Stream progress for an upload job as server-sent events"""
+    if job_id not in upload_jobs:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
+    
+    progress = upload_jobs[job_id]
+    
+    def generate():
+        while True:
+            try:
+                message = progress.get(timeout=SSE_KEEPALIVE_INTERVAL)
+            except queue.Empty:
+                yield b": keepalive\n\n"
+                continue
+            yield b"data: " + dumps_json(message) + b"\n\n"
+            if message.get('done'):
+                upload_jobs.pop(job_id, None)
+                upload_jobs_finished.pop(job_id, None)
+                break
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/api/sessions')
 def list_sessions():
     """List all active sessions"""
-    return jsonify({
+    return json_response({
         'success': True,
         'sessions': list(active_sessions.keys())
     })
@@ -339,15 +678,8 @@ def health_check():
     })
 
 if __name__ == '__main__':
-    # Load environment variables
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    # Run the application
-    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
-    port = int(os.environ.get('PORT', 5000))
-    
-    print(f"🎙️ Starting Podcast Transcriber Web App on port {port}")
-    print(f"📱 Open your browser to: http://localhost:{port}")
+    print(f"🎙️ Starting Podcast Transcriber Web App on port {CFG.port}")
+    print(f"📱 Open your browser to: http://localhost:{CFG.port}")
+    print("⚠️ Development server; use 'gunicorn -c gunicorn_conf.py app:app' in production")
     
-    app.run(host='0.0.0.0', port=port, debug=debug_mode)
+    app.run(host='0.0.0.0', port=CFG.port, debug=CFG.debug)
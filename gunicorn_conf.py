@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the Podcast Transcriber web app
+
+Usage: gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Sessions, the audio device and the transcription worker live in-process,
+# so everything must be served by a single worker process. Threads (rather
+# than gevent greenlets) keep the PortAudio callbacks and the blocking
+# transcription queue working unpatched; each open SSE stream holds one.
+workers = 1
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 100))
+
+# SSE streams stay open indefinitely; heartbeats are sent every 15s
+timeout = 0
+keepalive = 75
@@ -2,9 +2,17 @@ import sys
 import threading
 import queue
 import time
-import tempfile
+import struct
 import os
 import json
+import math
+import re
+import collections
+import functools
+import sqlite3
+import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QTabWidget, QVBoxLayout, QLabel,
     QTextBrowser, QHBoxLayout, QSplitter, QFrame, QPushButton,
@@ -13,18 +21,28 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QThread
 from PyQt5.QtGui import QFont, QPalette, QColor, QTextCursor, QTextCharFormat
 
+from services.json_utils import dumps_json, loads_json
+
 # OpenAI imports
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     import sounddevice as sd
     import numpy as np
-    import wave
     OPENAI_AVAILABLE = True
 except ImportError as e:
     OPENAI_AVAILABLE = False
     print(f"Required packages not available: {e}")
     print("Install with: pip install requests sounddevice numpy")
 
+# Optional voice activity detector; falls back to the RMS silence gate
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -37,9 +55,72 @@ except ImportError:
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     print(f"API Key loaded (no dotenv): {bool(OPENAI_API_KEY)}")
 
+log = logging.getLogger(__name__)
+
+# 44-byte RIFF/WAVE header for 16-bit mono PCM
+_WAV_HDR = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# Multipart framing for Whisper uploads; only the WAV part varies per chunk
+_WHISPER_BOUNDARY = 'transcriber-' + os.urandom(12).hex()
+_WHISPER_CONTENT_TYPE = f'multipart/form-data; boundary={_WHISPER_BOUNDARY}'
+_WHISPER_FORM_HEAD = (
+    f'--{_WHISPER_BOUNDARY}\r\nContent-Disposition: form-data; name="model"\r\n\r\nwhisper-1\r\n'
+    f'--{_WHISPER_BOUNDARY}\r\nContent-Disposition: form-data; name="language"\r\n\r\nde\r\n'
+    f'--{_WHISPER_BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="audio.wav"\r\n'
+    'Content-Type: audio/wav\r\n\r\n'
+).encode()
+_WHISPER_FORM_TAIL = f'\r\n--{_WHISPER_BOUNDARY}--\r\n'.encode()
+
+AUDIO_DEBUG = os.getenv('AUDIO_DEBUG', 'False').lower() == 'true'
+
+# Consecutive chunks overlap and _process_transcription appends in arrival order,
+# so one worker uploads them strictly in capture order
+UPLOAD_WORKERS = 1
+
+# Word definition cache: in-memory LRU in front of a persistent SQLite table
+DEFINITION_MEM_CACHE_SIZE = 512
+DEFINITION_DB_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'podcast-transcriber', 'defs.db')
+DEFINITION_DB_TTL = 30 * 24 * 3600  # 30 days
+# Prefetch runs one word at a time, paced so background lookups stay polite to the
+# public dictionaries and never hold up a click
+PREFETCH_WORKERS = 1
+PREFETCH_INTERVAL = 1.0  # seconds between prefetched words
+# Shared pool for click-driven lookups; also caps concurrent requests to the providers
+EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dict")
+# DE and EN Wiktionary fetches; separate from EXECUTOR so a lookup never waits on its own pool
+WIKTIONARY_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wiktionary")
+PREFETCH_MAX_WORDS = 8  # Queued at once; longest (rarest) words first
+_PREFETCH_WORD_RE = re.compile(r'[^\W\d_]{4,}')
+# Hosts the word panel talks to, contacted once at startup so the first click finds
+# DNS resolved and a TLS connection idle in the session pool
+DICTIONARY_WARMUP_URLS = (
+    'https://de.wiktionary.org/',
+    'https://en.wiktionary.org/',
+    'https://api.dictionaryapi.dev/',
+    'https://api.openai.com/v1/models',
+    'https://libretranslate.de/',
+)
+
+def _load_german_fallback():
+    """Load the bundled German-English word list used before any network lookup"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'german_fallback.json')
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        log.warning("German fallback dictionary unavailable: %s", e)
+        return {}
+
+# Common German words (articles, pronouns, particles) answered without a network call
+GERMAN_FALLBACK = _load_german_fallback()
+
+VAD_FRAME = 320  # webrtcvad accepts 10/20/30 ms frames; 20 ms at 16 kHz
+
 class AudioTranscriber(QObject):
-    transcription_updated = pyqtSignal(str)
+    transcription_updated = pyqtSignal(list, str)  # (completed sentences, current sentence or "")
     status_updated = pyqtSignal(str)
+    # Emitted by the upload worker once the last chunk of a session is transcribed
+    upload_drained = pyqtSignal(int)  # listening generation
     
     def __init__(self):
         super().__init__()
@@ -47,25 +128,51 @@ class AudioTranscriber(QObject):
         self.is_listening = False
         self.audio_thread = None
         self.sentences = []  # Store completed sentences
+        self._sentence_set = set()  # Same sentences, for O(1) duplicate checks
         self.current_sentence = ""  # Current sentence being transcribed
         
         # Smart audio buffering settings
-        self.audio_buffer = []
         self.chunk_count = 0
         self.silence_detection_threshold = 0.01  # Volume threshold for silence
         self.silence_duration = 0  # Track silence duration in seconds
         self.min_silence_for_send = 1.5  # Send after 1.5 seconds of silence
         self.max_buffer_duration = 8  # Maximum 8 seconds before forced send
         self.last_audio_time = 0
-        self.chunk_duration = 0.1  # Process in 100ms chunks for responsiveness
+        self.chunk_duration = 0.02  # 20ms blocks; also the VAD frame size
         self.last_processing_time = 0
         
+        if OPENAI_AVAILABLE:
+            # Enumerating host APIs is slow on some platforms; do it once
+            self._devices = sd.query_devices()
+            # Preallocated capture buffer: samples live in _ring[:_write]
+            self._ring = np.empty(int(16000 * self.max_buffer_duration * 1.5), dtype=np.int16)
+            # float32 scratch for one block, so the RMS gate never allocates
+            self._block_scratch = np.empty(int(16000 * self.chunk_duration), dtype=np.float32)
+        self._write = 0
+        # Sum of squares of each block in the last 0.5 s, for the RMS gate (unused with VAD)
+        self._block_ss = collections.deque(maxlen=int(0.5 / self.chunk_duration))
+        self._vad = webrtcvad.Vad(2) if WEBRTCVAD_AVAILABLE else None
+        # Chunks waiting for upload; the audio thread never blocks on the network
+        self._upload_q = None
+        self._upload_executor = None
+        self._stop_event = None
+        # Bumped per start_listening, so a late drain from an earlier session is ignored
+        self._listen_gen = 0
+        self._drained = False
+        
         if OPENAI_AVAILABLE and OPENAI_API_KEY:
             print("OpenAI API ready (using direct requests)")
             self.api_key = OPENAI_API_KEY
             self.client = "requests"  # Use requests instead of OpenAI client
+            # One keep-alive session shared by the upload workers
+            self._session = requests.Session()
+            self._session.headers['Authorization'] = f'Bearer {self.api_key}'
+            self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
         else:
             print("OpenAI not available or API key not found")
+        
+        # Queued to the GUI thread, so the final promotion never races the worker
+        self.upload_drained.connect(self._finish_listening)
     
     def start_listening(self):
         if not OPENAI_AVAILABLE:
@@ -89,136 +196,194 @@ class AudioTranscriber(QObject):
         self.silence_duration = 0
         self.last_audio_time = 0
         self.last_processing_time = 0
+        self._block_ss.clear()
         
         # Don't clear previous transcription - keep accumulating
         
-        # Start audio recording thread
-        self.audio_thread = threading.Thread(target=self._record_audio, daemon=True)
+        # Start upload workers, then the audio recording thread
+        self._upload_q = queue.Queue(maxsize=4)
+        self._upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
+        self._listen_gen += 1
+        self._drained = False
+        for _ in range(UPLOAD_WORKERS):
+            self._upload_executor.submit(self._upload_worker, self._upload_q, self._listen_gen)
+        self._stop_event = threading.Event()
+        self.audio_thread = threading.Thread(
+            target=self._record_audio, args=(self._upload_q, self._upload_executor, self._stop_event), daemon=True
+        )
         self.audio_thread.start()
         print("Audio thread started")
     
     def stop_listening(self):
+        # The recording thread flushes any remaining audio once it sees this; the
+        # current sentence is promoted after the upload worker has transcribed it
         self.is_listening = False
-        # Process any remaining audio in buffer
-        if self.audio_buffer and len(self.audio_buffer) > 16000:  # At least 1 second
-            print("Processing remaining audio on stop...")
-            self._process_audio_chunk(self.audio_buffer, 16000)
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._drained:
+            # The recording thread already gave up (e.g. no microphone)
+            self._finish_listening(self._listen_gen)
+        else:
+            self.status_updated.emit("Finishing...")
+    
+    def _finish_listening(self, gen):
+        """Promote the trailing sentence once the upload worker has drained (GUI thread)"""
+        if gen != self._listen_gen:
+            return  # Drain from a session that listening has since restarted over
+        self._drained = True
+        if self.is_listening:
+            return  # Still listening; stop_listening finishes up
         
         # If there's a current sentence, add it as a completed sentence
         if self.current_sentence and self.current_sentence.strip():
             self.sentences.append(self.current_sentence.strip())
-            self.transcription_updated.emit(self.current_sentence.strip())
+            self._sentence_set.add(self.sentences[-1])
+            self.transcription_updated.emit([self.current_sentence.strip()], "")
             self.current_sentence = ""
         self.status_updated.emit("Ready to listen")
     
-    def _record_audio(self):
+    def _record_audio(self, upload_q, upload_executor, stop_event):
         try:
-            # Audio recording parameters
-            sample_rate = 16000
-            channels = 1
-            
             print("Starting audio recording...")
-            print("Available audio devices:")
-            print(sd.query_devices())
+            devices = self._devices
+            if AUDIO_DEBUG:
+                print("Available audio devices:")
+                print(devices)
             
-            # Try to use the default input device (usually microphone)
-            try:
-                with sd.InputStream(
-                    samplerate=sample_rate, 
-                    channels=channels, 
-                    dtype=np.float32,
-                    device=None,  # Use default input device
-                    blocksize=int(sample_rate * self.chunk_duration)  # 100ms chunks
-                ) as stream:
-                    chunk_count = 0
-                    chunk_count = 0
-                    
-                    while self.is_listening:
-                        try:
-                            # Record audio in chunks
-                            audio_chunk, _ = stream.read(int(sample_rate * self.chunk_duration))
-                            self.audio_buffer.extend(audio_chunk.flatten())
-                            chunk_count += 1
-                            
-                            # Process audio every 3 seconds
-                            if len(self.audio_buffer) >= sample_rate * 3:  # 3 seconds of audio
-                                print(f"Processing audio chunk {chunk_count}...")
-                                self._process_audio_chunk(self.audio_buffer, sample_rate)
-                                self.audio_buffer = self.audio_buffer[sample_rate * 3:]  # Keep last 3 seconds
-                                
-                        except Exception as e:
-                            print(f"Audio recording error: {e}")
-                            break
-                            
-            except Exception as e:
-                print(f"Failed to open audio stream: {e}")
-                print("Trying alternative audio device...")
-                # Try with explicit device selection
-                devices = sd.query_devices()
-                input_devices = [i for i, device in enumerate(devices) if device['max_input_channels'] > 0]
-                if input_devices:
-                    print(f"Available input devices: {input_devices}")
-                    device_id = input_devices[0]  # Use first available input device
+            # PortAudio delivers each block to a callback on its real-time thread;
+            # this thread only keeps the stream open until listening stops
+            def callback(indata, frames, time_info, status):
+                self._on_audio_block(upload_q, indata)
+            
+            # Try the default input device (usually microphone), then each input device in turn
+            input_devices = [i for i, device in enumerate(devices) if device['max_input_channels'] > 0]
+            for device_id in [None] + input_devices:
+                if device_id is not None:
                     print(f"Using device {device_id}: {devices[device_id]['name']}")
-                    
-                    with sd.InputStream(
-                        samplerate=sample_rate, 
-                        channels=channels, 
-                        dtype=np.float32,
-                        device=device_id,
-                        blocksize=int(sample_rate * self.chunk_duration)  # 100ms chunks
-                    ) as stream:
-                        chunk_count = 0
-                        chunk_count = 0
-                        
-                        while self.is_listening:
-                            try:
-                                # Record audio in chunks
-                                audio_chunk, _ = stream.read(int(sample_rate * self.chunk_duration))
-                                self.audio_buffer.extend(audio_chunk.flatten())
-                                chunk_count += 1
-                                
-                                # Calculate current time
-                                current_time = chunk_count * self.chunk_duration
-                                
-                                # Check if we should process audio
-                                should_process = self._should_process_audio(current_time)
-                                
-                                if should_process:
-                                    print(f"Processing audio chunk {chunk_count} (smart timing)...")
-                                    self._process_audio_chunk(self.audio_buffer.copy(), sample_rate)
-                                    # Keep last 2 seconds for context
-                                    keep_samples = int(sample_rate * 2)
-                                    self.audio_buffer = self.audio_buffer[-keep_samples:] if len(self.audio_buffer) > keep_samples else []
-                                    self.last_processing_time = current_time
-                                    
-                            except Exception as e:
-                                print(f"Audio recording error: {e}")
-                                break
-                else:
-                    print("No input devices found!")
-                    self.status_updated.emit("No microphone found")
+                try:
+                    # Entering the stream starts it; a device can open but fail to start
+                    with self._open_stream(device_id, callback):
+                        stop_event.wait()
+                    return
+                except sd.PortAudioError as e:
+                    print(f"Failed to open audio stream: {e}")
+                    print("Trying alternative audio device...")
+                    continue
+            
+            print("No working input device found!")
+            self.status_updated.emit("No microphone found")
                         
         except Exception as e:
             print(f"Audio setup error: {e}")
             self.status_updated.emit(f"Audio error: {e}")
+        finally:
+            # Process any remaining audio in buffer
+            if self._write > 16000:  # At least 1 second
+                print("Processing remaining audio on stop...")
+                self._enqueue_chunk(upload_q, self._ring[:self._write].copy(), 16000)
+            self._write = 0
+            # Let the workers drain the queue and exit
+            for _ in range(UPLOAD_WORKERS):
+                upload_q.put(None)
+            upload_executor.shutdown(wait=False)
+    
+    def _open_stream(self, device, callback):
+        """Open a 16 kHz mono int16 input stream on the given device (None for the default)"""
+        return sd.InputStream(
+            samplerate=16000,
+            channels=1,
+            dtype='int16',
+            device=device,
+            blocksize=int(16000 * self.chunk_duration),  # 20ms blocks
+            latency='low',
+            callback=callback
+        )
+    
+    def _on_audio_block(self, upload_q, indata):
+        """Handle one captured block (runs on the PortAudio thread)"""
+        try:
+            self._append_audio(indata[:, 0])
+            self.chunk_count += 1
+            
+            # Calculate current time
+            current_time = self.chunk_count * self.chunk_duration
+            
+            # Check if we should process audio
+            if self._should_process_audio(current_time):
+                log.debug("Processing audio chunk %d (smart timing)", self.chunk_count)
+                self._enqueue_chunk(upload_q, self._ring[:self._write].copy(), 16000)
+                # Keep last 2 seconds for context
+                keep_samples = int(16000 * 2)
+                self._keep_audio(keep_samples if self._write > keep_samples else 0)
+                self.last_processing_time = current_time
+                
+        except Exception as e:
+            log.warning("Audio recording error: %s", e)
+    
+    def _enqueue_chunk(self, upload_q, audio_data, sample_rate):
+        """Hand a chunk to the upload workers, dropping the oldest one if they fall behind"""
+        while True:
+            try:
+                upload_q.put_nowait((audio_data, sample_rate))
+                return
+            except queue.Full:
+                try:
+                    upload_q.get_nowait()
+                    log.warning("Upload queue full, dropping oldest chunk")
+                except queue.Empty:
+                    pass
+    
+    def _upload_worker(self, upload_q, gen):
+        """Transcribe queued chunks until the None sentinel arrives"""
+        while True:
+            item = upload_q.get()
+            if item is None:
+                self.upload_drained.emit(gen)
+                return
+            self._process_audio_chunk(*item)
+    
+    def _append_audio(self, samples):
+        """Copy a block of samples onto the end of the capture buffer"""
+        n = len(samples)
+        if self._write + n > len(self._ring):
+            # Buffer full; drop the oldest audio to make room
+            self._keep_audio(len(self._ring) - n)
+        self._ring[self._write:self._write + n] = samples
+        self._write += n
+        if self._vad is None:
+            # int16 squares overflow; widen into the scratch block before the dot
+            block = self._block_scratch[:n] if n <= len(self._block_scratch) else np.empty(n, dtype=np.float32)
+            np.copyto(block, samples)
+            self._block_ss.append(float(np.dot(block, block)))
+    
+    def _keep_audio(self, keep):
+        """Discard all but the newest `keep` samples of the capture buffer"""
+        keep = max(0, keep)
+        if keep:
+            np.copyto(self._ring[:keep], self._ring[self._write - keep:self._write])
+        self._write = keep
+    
+    def _block_is_silent(self):
+        """Whether the most recent block contains no speech"""
+        if self._vad is not None:
+            n = int(16000 * self.chunk_duration)
+            pcm = self._ring[self._write - n:self._write]
+            return not any(
+                self._vad.is_speech(pcm[i:i + VAD_FRAME].tobytes(), 16000)
+                for i in range(0, n - VAD_FRAME + 1, VAD_FRAME)
+            )
+        
+        # Audio volume (RMS) over the last 0.5 seconds of blocks, in int16 units
+        rms_volume = math.sqrt(sum(self._block_ss) / (len(self._block_ss) * 16000 * self.chunk_duration))
+        return rms_volume < self.silence_detection_threshold * 32768
     
     def _should_process_audio(self, current_time):
         """Smart logic to determine when to send audio for transcription"""
-        if not self.audio_buffer:
-            return False
-            
-        # Calculate audio volume (RMS) from last 0.5 seconds
-        recent_samples = int(16000 * 0.5)  # 0.5 seconds
-        audio_array = np.array(self.audio_buffer[-recent_samples:]) if len(self.audio_buffer) >= recent_samples else np.array(self.audio_buffer)
-        
-        if len(audio_array) == 0:
+        if not self._write:
             return False
             
-        rms_volume = np.sqrt(np.mean(audio_array**2))
-        
         # Check for silence
-        is_silent = rms_volume < self.silence_detection_threshold
+        is_silent = self._block_is_silent()
         
         if is_silent:
             self.silence_duration += self.chunk_duration
@@ -229,79 +394,61 @@ class AudioTranscriber(QObject):
         # Decision logic:
         # 1. Send if we've had silence for min_silence_for_send seconds
         if self.silence_duration >= self.min_silence_for_send:
-            print(f"Sending due to silence: {self.silence_duration:.1f}s")
+            log.debug("Sending due to silence: %.1fs", self.silence_duration)
             return True
             
         # 2. Send if buffer is getting too long (max_buffer_duration)
-        buffer_duration = len(self.audio_buffer) / 16000
+        buffer_duration = self._write / 16000
         if buffer_duration >= self.max_buffer_duration:
-            print(f"Sending due to max buffer duration: {buffer_duration:.1f}s")
+            log.debug("Sending due to max buffer duration: %.1fs", buffer_duration)
             return True
             
         # 3. Send if we've been recording for a while without processing
         time_since_last_processing = current_time - self.last_processing_time
         if time_since_last_processing >= 5.0:  # 5 seconds without processing
-            print(f"Sending due to time since last processing: {time_since_last_processing:.1f}s")
+            log.debug("Sending due to time since last processing: %.1fs", time_since_last_processing)
             return True
             
         return False
 
     def _process_audio_chunk(self, audio_data, sample_rate):
         try:
-            # Save audio to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_filename = temp_file.name
-                
-                # Write WAV file
-                with wave.open(temp_filename, 'wb') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(sample_rate)
-                    wav_file.writeframes((np.array(audio_data) * 32767).astype(np.int16).tobytes())
-                
-                # Transcribe with OpenAI Whisper API using direct requests
-                try:
-                    with open(temp_filename, 'rb') as audio_file:
-                        files = {
-                            'file': ('audio.wav', audio_file, 'audio/wav')
-                        }
-                        data = {
-                            'model': 'whisper-1',
-                            'language': 'de'
-                        }
-                        headers = {
-                            'Authorization': f'Bearer {self.api_key}'
-                        }
-                        
-                        response = requests.post(
-                            'https://api.openai.com/v1/audio/transcriptions',
-                            headers=headers,
-                            files=files,
-                            data=data,
-                            timeout=30
-                        )
-                        
-                        if response.status_code == 200:
-                            transcript = response.json()
-                        else:
-                            print(f"API error: {response.status_code} - {response.text}")
-                            return
-                            
-                except Exception as api_error:
-                    print(f"OpenAI API error: {api_error}")
-                    return
+            # Encode as a 16-bit mono WAV in memory
+            n = len(audio_data)
+            header = _WAV_HDR.pack(b'RIFF', 36 + n * 2, b'WAVE', b'fmt ', 16, 1, 1,
+                                   sample_rate, sample_rate * 2, 2, 16, b'data', n * 2)
+            
+            # Transcribe with OpenAI Whisper API using direct requests
+            try:
+                # Assemble the multipart body in a single copy; the int16 samples
+                # are joined straight from the capture chunk
+                body = b''.join((_WHISPER_FORM_HEAD, header, audio_data.data, _WHISPER_FORM_TAIL))
                 
-                # Clean up temp file
-                os.unlink(temp_filename)
+                response = self._session.post(
+                    'https://api.openai.com/v1/audio/transcriptions',
+                    data=body,
+                    headers={'Content-Type': _WHISPER_CONTENT_TYPE},
+                    timeout=30
+                )
                 
-                # Process the transcription
-                transcript_text = transcript.get('text', '') if isinstance(transcript, dict) else str(transcript)
-                if transcript_text.strip():
-                    print(f"Transcription result: {transcript_text.strip()}")
-                    self._process_transcription(transcript_text.strip())
+                if response.status_code == 200:
+                    transcript = loads_json(response.content)
                 else:
-                    print("No transcription text received")
+                    print(f"API error: {response.status_code} - {response.text}")
+                    return
                     
+            except Exception as api_error:
+                print(f"OpenAI API error: {api_error}")
+                return
+            
+            # Process the transcription
+            transcript_text = transcript.get('text', '') if isinstance(transcript, dict) else str(transcript)
+            if transcript_text.strip():
+                print(f"Transcription result: {transcript_text.strip()}")
+                self._process_transcription(transcript_text.strip())
+            else:
+                print("No transcription text received")
+                
         except Exception as e:
             print(f"Audio processing error: {e}")
     
@@ -309,28 +456,91 @@ class AudioTranscriber(QObject):
         """Process transcription and handle sentence completion"""
         # Simple sentence detection (look for periods, exclamation marks, question marks)
         sentences = []
-        current = ""
-        
-        for char in text:
-            current += char
-            if char in '.!?':
-                sentence = current.strip()
-                if sentence and len(sentence) > 1:  # Only add meaningful sentences
-                    sentences.append(sentence)
-                current = ""
-        
-        # If we have complete sentences, emit them
-        if sentences:
-            for sentence in sentences:
-                if sentence and sentence not in self.sentences:  # Avoid duplicates
-                    self.sentences.append(sentence)
-                    self.transcription_updated.emit(sentence)
+        end = 0
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            if len(sentence) > 1:  # Only add meaningful sentences
+                sentences.append(sentence)
+            end = match.end()
+        current = text[end:]
+        
+        # Collect new complete sentences
+        completed = []
+        for sentence in sentences:
+            if sentence and sentence not in self._sentence_set:  # Avoid duplicates
+                self._sentence_set.add(sentence)
+                self.sentences.append(sentence)
+                completed.append(sentence)
         
         # Update current sentence with remaining text
         remaining = current.strip()
         if remaining and remaining != self.current_sentence:
             self.current_sentence = remaining
-            self.transcription_updated.emit(f"CURRENT:{remaining}")
+        else:
+            remaining = ""
+        
+        # One signal per transcription result
+        if completed or remaining:
+            self.transcription_updated.emit(completed, remaining)
+
+# A run of text up to and including a sentence-ending mark
+_SENTENCE_RE = re.compile(r'[^.!?]*[.!?]')
+
+# Markup leftovers stripped from transcript text, applied in order
+_CLEAN_PATTERNS = [re.compile(p) for p in (
+    r'<[^>]+>',                      # HTML tags
+    r'[;"]>:[^>]*>',                 # Remaining HTML-like patterns
+    r'cursor:\s*pointer[^>]*>',
+    r'font-weight:\s*bold[^>]*>',
+    r'text-shadow:[^>]*>',
+    r'color:\s*[^;]*;',
+    r'style="[^"]*"',
+    r'[;"]>',                        # Remaining artifacts
+    r'^\s*[;"]*',
+)]
+_MARKUP_CHARS = frozenset('<>:;"')
+
+# Play/stop button stylesheet, parsed once; the stop look is selected by the
+# button's "state" property
+_PLAY_BUTTON_QSS = """
+QPushButton {
+    background-color: rgba(255, 255, 255, 0.2);
+    color: white;
+    border: 2px solid rgba(255, 255, 255, 0.3);
+    border-radius: 30px;
+    width: 60px;
+    height: 60px;
+    font-size: 24px;
+    font-weight: bold;
+    outline: none;
+}
+QPushButton:hover {
+    background-color: rgba(255, 255, 255, 0.3);
+    border: 2px solid rgba(255, 255, 255, 0.5);
+}
+QPushButton:pressed {
+    background-color: rgba(255, 255, 255, 0.4);
+}
+QPushButton:focus {
+    outline: none;
+    border: 2px solid rgba(255, 255, 255, 0.3);
+}
+QPushButton[state="stop"] {
+    background-color: rgba(255, 0, 0, 0.3);
+    border: 2px solid rgba(255, 0, 0, 0.5);
+}
+QPushButton[state="stop"]:hover {
+    background-color: rgba(255, 0, 0, 0.4);
+    border: 2px solid rgba(255, 0, 0, 0.6);
+}
+QPushButton[state="stop"]:pressed {
+    background-color: rgba(255, 0, 0, 0.5);
+}
+QPushButton[state="stop"]:focus {
+    outline: none;
+    border: 2px solid rgba(255, 0, 0, 0.5);
+}
+"""
 
 class ScrollingTextDisplay(QFrame):
     word_clicked = pyqtSignal(str)  # Signal emitted when a word is clicked
@@ -386,6 +596,27 @@ class ScrollingTextDisplay(QFrame):
         self.current_hovered_word = None
         self.hovered_start = None
         self.hovered_end = None
+        # Coalesce hover restyling to at most once per frame
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._flush_hover)
+        
+        # Character formats, built once: completed sentences black, current sentence white/bold
+        self._fmt_sentence = QTextCharFormat()
+        self._fmt_sentence.setForeground(QColor("black"))
+        self._fmt_sentence.setFontPointSize(24)
+        self._fmt_current = QTextCharFormat()
+        self._fmt_current.setForeground(QColor("white"))
+        self._fmt_current.setFontPointSize(24)
+        self._fmt_current.setFontWeight(QFont.Bold)
+        self._fmt_hover = QTextCharFormat()
+        self._fmt_hover.setForeground(QColor("white"))
+        self._fmt_hover.setFontWeight(QFont.Bold)
+        # Slightly increase size for a modern effect
+        self._fmt_hover.setFontPointSize(26)
+        # Document position where the current (in-progress) sentence starts
+        self._cur_begin = 0
         
         # Status and button container (aligned horizontally)
         status_button_container = QWidget()
@@ -411,30 +642,7 @@ class ScrollingTextDisplay(QFrame):
         status_button_layout.addStretch()  # Push button to the right
         
         self.play_button = QPushButton("▶")
-        self.play_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.2);
-                color: white;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 30px;
-                width: 60px;
-                height: 60px;
-                font-size: 24px;
-                font-weight: bold;
-                outline: none;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.3);
-                border: 2px solid rgba(255, 255, 255, 0.5);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.4);
-            }
-            QPushButton:focus {
-                outline: none;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-        """)
+        self.play_button.setStyleSheet(_PLAY_BUTTON_QSS)
         self.play_button.setFixedSize(60, 60)
         self.play_button.setFocusPolicy(Qt.NoFocus)  # Remove focus outline
         
@@ -452,36 +660,36 @@ class ScrollingTextDisplay(QFrame):
         """Add a completed sentence (will be displayed in black)"""
         self.sentences.append(sentence)
         self.current_sentence = ""  # Clear current sentence when adding completed one
-        self._update_display()
+        
+        # The completed sentence replaces the current one at the end of the document
+        clean_sentence = self._clean_text(sentence.strip())
+        cursor = self._current_sentence_cursor()
+        if clean_sentence:
+            cursor.insertText(clean_sentence + "\n\n", self._fmt_sentence)
+        else:
+            cursor.removeSelectedText()
+        self._cur_begin = cursor.position()
+        self._scroll_to_end()
     
     def update_current_sentence(self, sentence):
         """Update the current sentence being transcribed (displayed in white)"""
         self.current_sentence = sentence
-        self._update_display()
+        cursor = self._current_sentence_cursor()
+        cursor.removeSelectedText()
+        clean_current = self._clean_text(sentence.strip())
+        if clean_current:
+            cursor.insertText(clean_current, self._fmt_current)
+        self._scroll_to_end()
     
-    def _update_display(self):
-        """Update the text display with completed and current sentences"""
-        # Create clean text content without HTML
-        text_content = ""
-        
-        # Add completed sentences in black
-        for sentence in self.sentences:
-            if sentence.strip():  # Only add non-empty sentences
-                clean_sentence = self._clean_text(sentence.strip())
-                text_content += clean_sentence + "\n\n"
-        
-        # Add current sentence in white (newest sentence)
-        if self.current_sentence and self.current_sentence.strip():
-            clean_current = self._clean_text(self.current_sentence.strip())
-            text_content += clean_current
-        
-        # Set plain text instead of HTML
-        self.text_display.setPlainText(text_content)
-        
-        # Apply styling to the text
-        self._apply_text_styling()
-        
-        # Ensure proper scrolling - scroll to show the current sentence
+    def _current_sentence_cursor(self):
+        """Cursor selecting the current sentence span at the end of the document"""
+        cursor = QTextCursor(self.text_display.document())
+        cursor.setPosition(self._cur_begin)
+        cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+        return cursor
+    
+    def _scroll_to_end(self):
+        """Keep the current sentence in view"""
         cursor = self.text_display.textCursor()
         cursor.movePosition(QTextCursor.End)
         self.text_display.setTextCursor(cursor)
@@ -492,55 +700,13 @@ class ScrollingTextDisplay(QFrame):
     
     def _clean_text(self, text):
         """Clean text by removing any HTML tags and unwanted characters"""
-        import re
-        # Remove HTML tags
-        clean = re.sub(r'<[^>]+>', '', text)
-        # Remove any remaining HTML-like patterns
-        clean = re.sub(r'[;"]>:[^>]*>', '', clean)
-        clean = re.sub(r'cursor:\s*pointer[^>]*>', '', clean)
-        clean = re.sub(r'font-weight:\s*bold[^>]*>', '', clean)
-        clean = re.sub(r'text-shadow:[^>]*>', '', clean)
-        clean = re.sub(r'color:\s*[^;]*;', '', clean)
-        clean = re.sub(r'style="[^"]*"', '', clean)
-        clean = re.sub(r'<span[^>]*>', '', clean)
-        clean = re.sub(r'</span>', '', clean)
-        # Clean up any remaining artifacts
-        clean = re.sub(r'[;"]>', '', clean)
-        clean = re.sub(r'^\s*[;"]*', '', clean)
+        if not _MARKUP_CHARS.intersection(text):
+            return text.strip()  # Plain transcript text, nothing to strip
+        clean = text
+        for pattern in _CLEAN_PATTERNS:
+            clean = pattern.sub('', clean)
         return clean.strip()
     
-    def _apply_text_styling(self):
-        """Apply styling to the text using QTextCharFormat"""
-        cursor = self.text_display.textCursor()
-        cursor.movePosition(QTextCursor.Start)
-        
-        # Style completed sentences (black)
-        for sentence in self.sentences:
-            if sentence.strip():
-                clean_sentence = self._clean_text(sentence.strip())
-                if clean_sentence:
-                    # Find and style this sentence
-                    cursor.select(QTextCursor.LineUnderCursor)
-                    format = QTextCharFormat()
-                    format.setForeground(QColor("black"))
-                    format.setFontPointSize(24)
-                    cursor.setCharFormat(format)
-                    cursor.movePosition(QTextCursor.Down)
-                    cursor.movePosition(QTextCursor.Down)  # Skip empty line
-        
-        # Style current sentence (white, bold)
-        if self.current_sentence and self.current_sentence.strip():
-            clean_current = self._clean_text(self.current_sentence.strip())
-            if clean_current:
-                cursor.select(QTextCursor.LineUnderCursor)
-                format = QTextCharFormat()
-                format.setForeground(QColor("white"))
-                format.setFontPointSize(24)
-                format.setFontWeight(QFont.Bold)
-                cursor.setCharFormat(format)
-    
-    
-    
     def on_mouse_press(self, event):
         """Handle mouse clicks to detect word clicks"""
         if event.button() == Qt.LeftButton:
@@ -575,7 +741,7 @@ class ScrollingTextDisplay(QFrame):
                 # Remember the hovered selection range
                 self.hovered_start = cursor.selectionStart()
                 self.hovered_end = cursor.selectionEnd()
-                self._update_hover_effect(word)
+                self._hover_timer.start()
             else:
                 # Update hovered range if mouse moved within same word
                 self.hovered_start = cursor.selectionStart()
@@ -588,7 +754,7 @@ class ScrollingTextDisplay(QFrame):
                 self.current_hovered_word = None
                 self.hovered_start = None
                 self.hovered_end = None
-                self._update_display()  # Refresh to remove hover effects
+                self._hover_timer.start()  # Refresh to remove hover effects
         
         # Call the original mouse move event
         QTextEdit.mouseMoveEvent(self.text_display, event)
@@ -601,73 +767,24 @@ class ScrollingTextDisplay(QFrame):
             self.current_hovered_word = None
             self.hovered_start = None
             self.hovered_end = None
-            self._update_display()  # Refresh to remove hover effects
+            self._hover_timer.start()  # Refresh to remove hover effects
         QTextEdit.leaveEvent(self.text_display, event)
     
-    def _update_hover_effect(self, hovered_word):
-        """Update display with hover effect for specific word using QTextCharFormat"""
-        # Get the current text content
-        text_content = ""
-        
-        # Add completed sentences in black
-        for sentence in self.sentences:
-            if sentence.strip():
-                clean_sentence = self._clean_text(sentence.strip())
-                text_content += clean_sentence + "\n\n"
-        
-        # Add current sentence in white
-        if self.current_sentence and self.current_sentence.strip():
-            clean_current = self._clean_text(self.current_sentence.strip())
-            text_content += clean_current
-        
-        # Set plain text
-        self.text_display.setPlainText(text_content)
-        
-        # Apply styling with hover effect
-        self._apply_text_styling_with_hover(hovered_word)
-        
-        # Ensure proper scrolling
-        cursor = self.text_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.text_display.setTextCursor(cursor)
-        scrollbar = self.text_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+    def _flush_hover(self):
+        """Apply the newest hover state once the debounce timer fires"""
+        self._update_hover_effect(self.current_hovered_word)
     
-    def _apply_text_styling_with_hover(self, hovered_word):
-        """Apply styling to the text with hover effect using QTextCharFormat"""
-        cursor = self.text_display.textCursor()
-        cursor.movePosition(QTextCursor.Start)
-
-        # 1) Base styling: completed sentences black, current sentence white/bold
-        for sentence in self.sentences:
-            if sentence.strip():
-                cursor.select(QTextCursor.LineUnderCursor)
-                base_format = QTextCharFormat()
-                base_format.setForeground(QColor("black"))
-                base_format.setFontPointSize(24)
-                cursor.setCharFormat(base_format)
-                cursor.movePosition(QTextCursor.Down)
-                cursor.movePosition(QTextCursor.Down)  # Skip empty line
-
-        if self.current_sentence and self.current_sentence.strip():
-            cursor.select(QTextCursor.LineUnderCursor)
-            current_format = QTextCharFormat()
-            current_format.setForeground(QColor("white"))
-            current_format.setFontPointSize(24)
-            current_format.setFontWeight(QFont.Bold)
-            cursor.setCharFormat(current_format)
-
-        # 2) Hover styling: highlight only the hovered word range
+    def _update_hover_effect(self, hovered_word):
+        """Overlay the hover style on the hovered word without touching the document"""
+        selections = []
         if hovered_word and self.hovered_start is not None and self.hovered_end is not None:
-            word_cursor = self.text_display.textCursor()
-            word_cursor.setPosition(self.hovered_start)
-            word_cursor.setPosition(self.hovered_end, QTextCursor.KeepAnchor)
-            hover_format = QTextCharFormat()
-            hover_format.setForeground(QColor("white"))
-            hover_format.setFontWeight(QFont.Bold)
-            # Slightly increase size for a modern effect
-            hover_format.setFontPointSize(26)
-            word_cursor.setCharFormat(hover_format)
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(self.text_display.document())
+            selection.cursor.setPosition(self.hovered_start)
+            selection.cursor.setPosition(self.hovered_end, QTextCursor.KeepAnchor)
+            selection.format = self._fmt_hover
+            selections.append(selection)
+        self.text_display.setExtraSelections(selections)
     
     def update_status(self, status):
         self.status_label.setText(status)
@@ -677,19 +794,265 @@ class ScrollingTextDisplay(QFrame):
         self.sentences = []
         self.current_sentence = ""
         self.text_display.clear()
+        self.text_display.setExtraSelections([])
+        self._cur_begin = 0
+
+def _normalize_entry(raw):
+    """Coerce a provider's entry into the shape the word panel renders.
+
+    Keeps at most 3 meanings with up to 2 non-empty definitions each; definitions may
+    arrive as {'definition': ...} dicts or bare strings. The pronunciation falls back to
+    the first 'phonetics' text, as returned by dictionaryapi.dev.
+    """
+    if raw is None:
+        return None
+    phonetic = raw.get('phonetic') or next(
+        (ph['text'] for ph in raw.get('phonetics', []) if isinstance(ph, dict) and ph.get('text')), ''
+    )
+    meanings = []
+    for m in raw.get('meanings', [])[:3]:
+        defs = []
+        for d in m.get('definitions', []):
+            try:
+                text = d['definition']  # Common case: {'definition': ...}
+            except (TypeError, KeyError):
+                text = d if isinstance(d, str) else ''
+            if text:
+                defs.append({'definition': text})
+                if len(defs) == 2:
+                    break
+        meanings.append({'partOfSpeech': m.get('partOfSpeech', ''), 'definitions': defs})
+    similar = raw.get('similarWords') or {}
+    return {
+        'phonetic': phonetic,
+        'meanings': meanings,
+        'similarWords': {'english': similar.get('english', []), 'german': similar.get('german', [])},
+    }
+
+# Pronunciation field of a partially streamed OpenAI dictionary entry
+_PARTIAL_PHONETIC_RE = re.compile(r'"phonetic"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# OpenAI dictionary request; only the user message varies per word
+_OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+_OPENAI_DICT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a comprehensive dictionary assistant. Always return a JSON object with keys: "
+        "phonetic (string with IPA pronunciation, REQUIRED - never empty), meanings (array), similarWords (object). "
+        "Each meanings item has partOfSpeech (string) and definitions (array of objects with 'definition'). "
+        "similarWords should have 'english' (array of similar English words) and 'german' (array of similar German words). "
+        "Always respond in English. If the word is German, provide English definitions and identify the part of speech in English. "
+        "ALWAYS provide IPA pronunciation in phonetic field. Limit to at most 3 meanings and 2 definitions per meaning. "
+        "Include 3-5 similar words for each language."
+    ),
+}
+# Streamed so the pronunciation can be shown before the rest of the entry is generated
+_OPENAI_DICT_PAYLOAD = {
+    "model": "gpt-4o-mini",
+    "response_format": {"type": "json_object"},
+    "temperature": 0.2,
+    "stream": True,
+}
+# Outermost JSON object in a reply that wraps it in prose or code fences
+_JSON_BLOCK = re.compile(r'\{.*\}', re.DOTALL)
+# Slashes and brackets around an IPA transcription
+_IPA_CLEAN = re.compile(r'[\[\]/]')
+
+# Word panel stylesheets, parsed by Qt once when the panel is built
+_PANEL_QSS = """
+QFrame {
+    background-color: white;
+    border-radius: 10px;
+    border: none;
+}
+"""
+
+_WORD_LABEL_QSS = """
+QLabel {
+    color: #666;
+    font-size: 18px;
+    font-weight: normal;
+    font-style: italic;
+    background-color: transparent;
+    border: none;
+    padding: 0px;
+    margin: 0px;
+}
+QLabel[state="loaded"] {
+    color: black;
+    font-size: 28px;
+    font-weight: bold;
+    font-style: normal;
+    background-color: transparent;
+    border: none;
+    padding: 0px;
+    margin: 0px;
+}
+"""
+
+_STAR_ICON_QSS = """
+QLabel {
+    color: #666;
+    font-size: 24px;
+    background-color: transparent;
+    border: none;
+    padding: 0px;
+    margin: 0px;
+}
+"""
+
+_PHONETIC_QSS = """
+QLabel {
+    color: #666;
+    font-size: 16px;
+    font-style: italic;
+    background-color: transparent;
+    border: none;
+    padding: 0px;
+    margin: 20px 0px 0px 0px;
+}
+"""
+
+_SEPARATOR_QSS = """
+QFrame {
+    background-color: #E0E0E0;
+    border: none;
+    margin: 15px 0px;
+    max-height: 0.5px;
+    min-height: 0.5px;
+}
+"""
+
+_ADJ_LABEL_QSS = """
+QLabel {
+    color: #E52217;
+    font-size: 12px;
+    font-weight: bold;
+    background-color: transparent;
+    border: none;
+    padding: 0px;
+    margin: 10px 0px 0px 0px;
+}
+"""
+
+_DEFINITION_QSS = """
+QLabel {
+    color: black;
+    font-size: 18px;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    font-weight: 400;
+    line-height: 1.4;
+    background-color: transparent;
+    border: none;
+    padding: 0px;
+    margin: 5px 0px 0px 10px;
+}
+"""
+
+_ADV_LABEL_QSS = """
+QLabel {
+    color: #E52217;
+    font-size: 12px;
+    font-weight: bold;
+    background-color: transparent;
+    border: none;
+    border-top: 1px solid #E0E0E0;
+    padding: 15px 0px 0px 0px;
+    margin: 20px 0px 0px 0px;
+}
+"""
 
 class WordDefinitionPanel(QFrame):
+    # Carries (request seq, UI callback) from lookup threads to the GUI thread
+    _ui_update = pyqtSignal(int, object)
+    
     def __init__(self):
         super().__init__()
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 10px;
-                border: none;
-            }
-        """)
+        self.setStyleSheet(_PANEL_QSS)
         self.setupUI()
         
+        # Keep-alive connection pool shared by all dictionary and translation lookups
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Definitions seen before, keyed by lowercased word
+        self._mem_cache = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._db = self._open_definition_db()
+        
+        # Each click supersedes the lookups started by earlier ones
+        self._request_seq = 0
+        self._current_word = None
+        self._current_future = None
+        self._openai_headers = None  # Built on first OpenAI lookup
+        self._ui_update.connect(self._apply_ui_update)
+        
+        # Background prefetch of transcript words into the definition cache
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+        self._prefetching = set()
+        
+    def _open_definition_db(self):
+        """Open (creating if needed) the on-disk definition cache"""
+        try:
+            os.makedirs(os.path.dirname(DEFINITION_DB_PATH), exist_ok=True)
+            db = sqlite3.connect(DEFINITION_DB_PATH, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS defs (word TEXT PRIMARY KEY, entry TEXT, ts INTEGER)')
+            db.commit()
+            return db
+        except (OSError, sqlite3.Error) as e:
+            log.warning("Definition cache unavailable: %s", e)
+            return None
+    
+    def _get_cached_definition(self, key):
+        """Return a cached entry for the word, or None"""
+        with self._cache_lock:
+            entry = self._mem_cache.get(key)
+            if entry is not None:
+                self._mem_cache.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute('SELECT entry, ts FROM defs WHERE word = ?', (key,)).fetchone()
+            except sqlite3.Error as e:
+                log.warning("Definition cache read error: %s", e)
+                return None
+            if row is None or time.time() - row[1] > DEFINITION_DB_TTL:
+                return None
+            entry = _normalize_entry(loads_json(row[0]))
+            self._remember_definition(key, entry)
+            return entry
+    
+    def _remember_definition(self, key, entry):
+        """Insert into the in-memory LRU (caller holds the cache lock)"""
+        self._mem_cache[key] = entry
+        self._mem_cache.move_to_end(key)
+        if len(self._mem_cache) > DEFINITION_MEM_CACHE_SIZE:
+            self._mem_cache.popitem(last=False)
+    
+    def _cache_definition(self, key, entry):
+        """Store an entry in both cache tiers"""
+        with self._cache_lock:
+            self._remember_definition(key, entry)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO defs (word, entry, ts) VALUES (?, ?, ?)',
+                    (key, dumps_json(entry).decode('utf-8'), int(time.time()))
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                log.warning("Definition cache write error: %s", e)
+        
     def setupUI(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(30, 30, 30, 30)
@@ -701,31 +1064,11 @@ class WordDefinitionPanel(QFrame):
         word_header_layout.setSpacing(10)
         
         self.word_label = QLabel("Click on a word to look up its meaning")
-        self.word_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 18px;
-                font-weight: normal;
-                font-style: italic;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-        """)
+        self.word_label.setStyleSheet(_WORD_LABEL_QSS)
         self.word_label.setAlignment(Qt.AlignCenter)
         
         self.star_icon = QLabel("☆")
-        self.star_icon.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 24px;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-        """)
+        self.star_icon.setStyleSheet(_STAR_ICON_QSS)
         self.star_icon.setVisible(False)  # Hide by default
         
         word_header_layout.addWidget(self.word_label)
@@ -734,110 +1077,35 @@ class WordDefinitionPanel(QFrame):
         
         # Phonetic transcription
         self.phonetic = QLabel("/'vısnʃaftlıç/")
-        self.phonetic.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 16px;
-                font-style: italic;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 20px 0px 0px 0px;
-            }
-        """)
+        self.phonetic.setStyleSheet(_PHONETIC_QSS)
         self.phonetic.setVisible(False)  # Hide by default
         
         # Separator line
         self.separator = QFrame()
         self.separator.setFrameShape(QFrame.HLine)
-        self.separator.setStyleSheet("""
-            QFrame {
-                background-color: #E0E0E0;
-                border: none;
-                margin: 15px 0px;
-                max-height: 0.5px;
-                min-height: 0.5px;
-            }
-        """)
+        self.separator.setStyleSheet(_SEPARATOR_QSS)
         self.separator.setVisible(False)  # Hide by default
         
         # Adjective definition
         self.adj_label = QLabel("ADJECTIVE")
-        self.adj_label.setStyleSheet("""
-            QLabel {
-                color: #E52217;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 10px 0px 0px 0px;
-            }
-        """)
+        self.adj_label.setStyleSheet(_ADJ_LABEL_QSS)
         self.adj_label.setVisible(False)  # Hide by default
         
         self.adj_def1 = QLabel("• scientific")
-        self.adj_def1.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 18px;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                font-weight: 400;
-                line-height: 1.4;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 5px 0px 0px 10px;
-            }
-        """)
+        self.adj_def1.setStyleSheet(_DEFINITION_QSS)
         self.adj_def1.setVisible(False)  # Hide by default
         
         self.adj_def2 = QLabel("• academic (geisteswissenschaftlich)")
-        self.adj_def2.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 18px;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                font-weight: 400;
-                line-height: 1.4;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 5px 0px 0px 10px;
-            }
-        """)
+        self.adj_def2.setStyleSheet(_DEFINITION_QSS)
         self.adj_def2.setVisible(False)  # Hide by default
         
         # Adverb definition
         self.adv_label = QLabel("ADVERB")
-        self.adv_label.setStyleSheet("""
-            QLabel {
-                color: #E52217;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-                border-top: 1px solid #E0E0E0;
-                padding: 15px 0px 0px 0px;
-                margin: 20px 0px 0px 0px;
-            }
-        """)
+        self.adv_label.setStyleSheet(_ADV_LABEL_QSS)
         self.adv_label.setVisible(False)  # Hide by default
         
         self.adv_def = QLabel("• scientifically (arbeiten etw untersuchen)")
-        self.adv_def.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 18px;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                font-weight: 400;
-                line-height: 1.4;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 5px 0px 0px 10px;
-            }
-        """)
+        self.adv_def.setStyleSheet(_DEFINITION_QSS)
         self.adv_def.setVisible(False)  # Hide by default
         
         layout.addLayout(word_header_layout)
@@ -852,268 +1120,306 @@ class WordDefinitionPanel(QFrame):
         
         self.setLayout(layout)
     
+    def _set_word_label_state(self, state):
+        """Switch the word label between its placeholder and loaded styles"""
+        if self.word_label.property('state') == state:
+            return
+        self.word_label.setProperty('state', state)
+        # Re-resolve the [state=...] rules without reparsing the stylesheet
+        self.word_label.style().unpolish(self.word_label)
+        self.word_label.style().polish(self.word_label)
+    
     def show_word_loading(self, word):
         """Show word immediately with loading state"""
-        print(f"show_word_loading called with: {word}")
-        
-        # Update word label styling and show elements
-        self.word_label.setText(word)
-        self.word_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-        """)
-        
-        # Show star icon
-        self.star_icon.setVisible(True)
-        
-        # Show loading state
-        self.phonetic.setText("Loading...")
-        self.phonetic.setVisible(True)
-        
-        # Show separator
-        self.separator.setVisible(True)
+        self.setUpdatesEnabled(False)  # One layout and repaint for the whole update
+        try:
+            log.debug("show_word_loading called with: %s", word)
+            
+            # Update word label styling and show elements
+            self.word_label.setText(word)
+            self._set_word_label_state('loaded')
+            
+            # Show star icon
+            self.star_icon.setVisible(True)
+            
+            # Show loading state
+            self.phonetic.setText("Loading...")
+            self.phonetic.setVisible(True)
+            
+            # Show separator
+            self.separator.setVisible(True)
+            
+            # Show definition sections with loading text
+            self.adj_label.setVisible(True)
+            self.adj_def1.setVisible(True)
+            self.adj_def2.setVisible(False)
+            self.adv_label.setVisible(False)
+            self.adv_def.setVisible(False)
+            
+            self.adj_label.setText("LOADING")
+            self.adj_def1.setText("Loading definition...")
+            self.adj_def2.setText("")
+            self.adv_def.setText("")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def update_word(self, word, no_cache=False):
+        """Show a new word: straight from the cache, or a loading state while it is looked up"""
+        log.debug("update_word called with: %s", word)
         
-        # Show definition sections with loading text
-        self.adj_label.setVisible(True)
-        self.adj_def1.setVisible(True)
-        self.adj_def2.setVisible(False)
-        self.adv_label.setVisible(False)
-        self.adv_def.setVisible(False)
+        self._request_seq += 1
+        self._current_word = word
         
-        self.adj_label.setText("LOADING")
-        self.adj_def1.setText("Loading definition...")
-        self.adj_def2.setText("")
-        self.adv_def.setText("")
-
-    def update_word(self, word):
-        """Update the panel with a new word"""
-        print(f"update_word called with: {word}")
-        # The show_word_loading method already shows the word, so we just need to fetch definition
+        # Serve repeat lookups from the cache
+        if not no_cache:
+            entry = self._get_cached_definition(word.lower())
+            if entry is not None:
+                log.debug("Definition cache hit for: %s", word)
+                self._update_with_api_data(word, entry)
+                return
         
         # Look up word in dictionary API
-        self.lookup_word_definition(word)
+        self.show_word_loading(word)
+        self.lookup_word_definition(word, self._request_seq)
+    
+    def prefetch(self, words):
+        """Warm the definition cache for words the user is likely to click (GUI thread).
+
+        Only Wiktionary is used, and nothing is rendered; a later click on one of these
+        words is served from the cache. The transcript is German, so dictionaryapi.dev
+        (English only) is skipped.
+        """
+        candidates = []
+        room = PREFETCH_MAX_WORDS - len(self._prefetching)
+        with self._cache_lock:
+            for word in sorted(set(words), key=len, reverse=True):
+                if len(candidates) >= room:
+                    break
+                key = word.lower()
+                if key in self._prefetching or key in self._mem_cache or key in GERMAN_FALLBACK:
+                    continue
+                candidates.append(word)
+        for word in candidates:
+            self._prefetching.add(word.lower())
+            self._prefetch_executor.submit(self._prefetch_one, word)
+    
+    def _prefetch_one(self, word):
+        """Fetch one word into the cache (prefetch worker thread)"""
+        key = word.lower()
+        try:
+            if self._get_cached_definition(key) is not None:
+                return
+            # DE and EN one after the other, so clicks keep WIKTIONARY_EXECUTOR to themselves
+            entry = _normalize_entry(self._try_wiktionary(word, executor=None))
+            if entry and entry['meanings']:
+                self._cache_definition(key, entry)
+            time.sleep(PREFETCH_INTERVAL)
+        except Exception as e:
+            log.warning("Prefetch error for '%s': %s", word, e)
+        finally:
+            self._prefetching.discard(key)
+    
+    def warm_connections(self):
+        """Open pooled connections to the dictionary hosts (background thread)"""
+        for url in DICTIONARY_WARMUP_URLS:
+            try:
+                self._session.head(url, timeout=3)
+            except requests.RequestException as e:
+                log.debug("Connection warm-up failed for %s: %s", url, e)
+    
+    def _post_ui(self, seq, callback):
+        """Run callback on the GUI thread unless a newer lookup has started"""
+        self._ui_update.emit(seq, callback)
+    
+    def _apply_ui_update(self, seq, callback):
+        """Slot for _ui_update; drops results from superseded lookups"""
+        if seq != self._request_seq:
+            return  # Superseded by a newer click
+        callback()
+    
+    def _is_stale(self, seq):
+        """Whether a newer click has replaced the lookup with this seq"""
+        return seq != self._request_seq
     
-    def lookup_word_definition(self, word):
-        """Look up word definition using multiple dictionary APIs"""
-        import requests
-        import threading
+    def lookup_word_definition(self, word, seq):
+        """Look up word definition, trying the free dictionaries before OpenAI"""
+        translation = GERMAN_FALLBACK.get(word.lower())
+        if translation:
+            self._update_ui_with_translation(word, translation)
+            return
+        
+        providers = (
+            ('Wiktionary', self._try_wiktionary),
+            ('dictionaryapi.dev', self._try_dictionaryapi_en),
+            ('OpenAI', functools.partial(self._try_openai_dictionary, seq=seq)),
+        )
         
         def fetch_definition():
             try:
-                # Try a simple, reliable API first
-                print(f"Looking up word: '{word}'")
+                log.debug("Looking up word: '%s'", word)
                 
-                # 0) Try OpenAI dictionary API first
-                try:
-                    openai_entry = self._try_openai_dictionary(word)
-                    if openai_entry:
-                        print(f"OpenAI dictionary success, calling UI update for: {word}")
-                        self._update_with_api_data(word, openai_entry)
+                for name, provider in providers:
+                    if self._is_stale(seq):
+                        return
+                    try:
+                        entry = _normalize_entry(provider(word))
+                    except Exception as e:
+                        log.warning("%s dictionary error: %s", name, e)
+                        continue
+                    if entry:
+                        log.debug("%s dictionary success, calling UI update for: %s", name, word)
+                        # Cache here so the SQLite write stays off the GUI thread
+                        self._cache_definition(word.lower(), entry)
+                        self._post_ui(seq, lambda: self._update_with_api_data(word, entry))
                         return
-                    else:
-                        print(f"OpenAI dictionary returned None for: {word}")
-                except Exception as e:
-                    print(f"OpenAI dictionary error: {e}")
                 
-                # Try Wiktionary (EN/DE) as a fallback via REST v1
-                try:
-                    def parse_wiktionary_json(wk_data):
-                        # Wiktionary structure: { lang: [{partOfSpeech, definitions:[{definition}]}] }
-                        preferred_langs = ['de', 'en']
-                        for lang in preferred_langs:
-                            if lang in wk_data and wk_data[lang]:
-                                items = wk_data[lang]
-                                entry = {
-                                    'phonetic': '',
-                                    'phonetics': [],
-                                    'meanings': []
-                                }
-                                for item in items[:3]:
-                                    pos = item.get('partOfSpeech', '')
-                                    defs = item.get('definitions', [])
-                                    entry['meanings'].append({
-                                        'partOfSpeech': pos,
-                                        'definitions': [{'definition': d.get('definition', '')} for d in defs[:2]]
-                                    })
-                                return entry
-                        # Fallback: pick any language present
-                        for lang_key, items in wk_data.items():
-                            if isinstance(items, list) and items:
-                                entry = {
-                                    'phonetic': '',
-                                    'phonetics': [],
-                                    'meanings': []
-                                }
-                                for item in items[:3]:
-                                    pos = item.get('partOfSpeech', '')
-                                    defs = item.get('definitions', [])
-                                    entry['meanings'].append({
-                                        'partOfSpeech': pos,
-                                        'definitions': [{'definition': d.get('definition', '')} for d in defs[:2]]
-                                    })
-                                return entry
-                        return None
+                if self._is_stale(seq):
+                    return
+                
+                # Try translation as fallback (still on this background thread)
+                self._try_translation_api(word, seq)
+                    
+            except Exception as e:
+                log.warning("Dictionary lookup error: %s", e)
+                self._update_with_fallback(word, seq)
+        
+        # Run on the lookup pool to avoid blocking UI; a lookup that has not started
+        # yet is dropped when the next click arrives
+        if self._current_future is not None:
+            self._current_future.cancel()
+        self._current_future = EXECUTOR.submit(fetch_definition)
 
-                    # EN Wiktionary
-                    print("Trying Wiktionary (EN) fallback...")
-                    wk_url_en = f"https://en.wiktionary.org/api/rest_v1/page/definition/{word.lower()}"
-                    wk_resp_en = requests.get(wk_url_en, timeout=6, headers={
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
-                    })
-                    print(f"Wiktionary EN status: {wk_resp_en.status_code}")
-                    if wk_resp_en.status_code == 200:
-                        wk_data_en = wk_resp_en.json()
-                        entry = parse_wiktionary_json(wk_data_en)
-                        if entry:
-                            from PyQt5.QtCore import QTimer
-                            QTimer.singleShot(0, lambda: self._update_with_api_data(word, entry))
-                            return
+    def _parse_wiktionary_json(self, wk_data):
+        """Map a Wiktionary REST definition payload onto our entry format"""
+        # Wiktionary structure: { lang: [{partOfSpeech, definitions:[{definition}]}] }
+        # Prefer German, then English, then whichever language is present
+        for lang in ('de', 'en', *wk_data):
+            items = wk_data.get(lang)
+            if isinstance(items, list) and items:
+                return {
+                    'phonetic': '',
+                    'phonetics': [],
+                    'meanings': [
+                        {
+                            'partOfSpeech': item.get('partOfSpeech', ''),
+                            'definitions': [{'definition': d.get('definition', '')}
+                                            for d in item.get('definitions', [])[:2]]
+                        }
+                        for item in items[:3]
+                    ]
+                }
+        return None
 
-                    # DE Wiktionary
-                    print("Trying Wiktionary (DE) fallback...")
-                    wk_url_de = f"https://de.wiktionary.org/api/rest_v1/page/definition/{word.lower()}"
-                    wk_resp_de = requests.get(wk_url_de, timeout=6, headers={
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
-                    })
-                    print(f"Wiktionary DE status: {wk_resp_de.status_code}")
-                    if wk_resp_de.status_code == 200:
-                        wk_data_de = wk_resp_de.json()
-                        entry = parse_wiktionary_json(wk_data_de)
-                        if entry:
-                            from PyQt5.QtCore import QTimer
-                            QTimer.singleShot(0, lambda: self._update_with_api_data(word, entry))
-                            return
-                except Exception as e:
-                    print(f"Wiktionary fallback error: {e}")
+    def _try_wiktionary(self, word, executor=WIKTIONARY_EXECUTOR):
+        """Query DE and EN Wiktionary (REST v1), concurrently on executor if given; DE wins"""
+        def fetch_wiktionary(lang):
+            try:
+                wk_url = f"https://{lang}.wiktionary.org/api/rest_v1/page/definition/{word.lower()}"
+                wk_resp = self._session.get(wk_url, timeout=6)
+                log.debug("Wiktionary %s status: %s", lang.upper(), wk_resp.status_code)
+                if wk_resp.status_code == 200:
+                    return self._parse_wiktionary_json(loads_json(wk_resp.content))
+            except Exception as e:
+                log.warning("Wiktionary %s error: %s", lang.upper(), e)
+            return None
 
-                # Try OpenAI chat-based dictionary fallback
-                try:
-                    print("Trying OpenAI dictionary fallback...")
-                    openai_entry = self._try_openai_dictionary(word)
-                    if openai_entry:
-                        from PyQt5.QtCore import QTimer
-                        QTimer.singleShot(0, lambda: self._update_with_api_data(word, openai_entry))
-                        return
-                except Exception as e:
-                    print(f"OpenAI dictionary fallback error: {e}")
+        if executor is None:
+            return fetch_wiktionary('de') or fetch_wiktionary('en')
 
-                # Try translation as fallback
-                from PyQt5.QtCore import QTimer
-                QTimer.singleShot(0, lambda: self._try_translation_api(word))
-                    
-            except Exception as e:
-                print(f"Dictionary lookup error: {e}")
-                from PyQt5.QtCore import QTimer
-                QTimer.singleShot(0, lambda: self._update_with_fallback(word))
-        
-        # Run in background thread to avoid blocking UI
-        thread = threading.Thread(target=fetch_definition, daemon=True)
-        thread.start()
+        de_future = executor.submit(fetch_wiktionary, 'de')
+        en_future = executor.submit(fetch_wiktionary, 'en')
+        entry = de_future.result()
+        if entry:
+            en_future.cancel()  # Don't hold the lookup for a result we won't use
+            return entry
+        return en_future.result()
 
+    def _try_dictionaryapi_en(self, word):
+        """Look the word up on dictionaryapi.dev (English)"""
+        url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word.lower()}"
+        r = self._session.get(url, timeout=8)
+        log.debug("dictionaryapi.dev status: %s", r.status_code)
+        if r.status_code == 200:
+            data = loads_json(r.content)
+            if data:
+                return data[0]
+        return None
 
-    def _try_openai_dictionary(self, word):
+    def _try_openai_dictionary(self, word, seq=None):
         """Use OpenAI to get a structured dictionary-style entry for a word (EN/German)."""
-        import os
-        import json
-        import requests
-
-        api_key = os.environ.get('OPENAI_API_KEY')
-        if not api_key:
-            print("OPENAI_API_KEY not set; skipping OpenAI dictionary fallback")
+        if not OPENAI_API_KEY:
+            log.warning("OPENAI_API_KEY not set; skipping OpenAI dictionary fallback")
             return None
 
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        system_prompt = (
-            "You are a comprehensive dictionary assistant. Always return a JSON object with keys: "
-            "phonetic (string with IPA pronunciation, REQUIRED - never empty), meanings (array), similarWords (object). "
-            "Each meanings item has partOfSpeech (string) and definitions (array of objects with 'definition'). "
-            "similarWords should have 'english' (array of similar English words) and 'german' (array of similar German words). "
-            "Always respond in English. If the word is German, provide English definitions and identify the part of speech in English. "
-            "ALWAYS provide IPA pronunciation in phonetic field. Limit to at most 3 meanings and 2 definitions per meaning. "
-            "Include 3-5 similar words for each language."
-        )
-        user_prompt = (
-            f"Word: {word}\n"
-            "Return only the JSON object, no extra text."
-        )
-        payload = {
-            "model": "gpt-4o-mini",
-            "response_format": {"type": "json_object"},
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "temperature": 0.2
-        }
+        if self._openai_headers is None:
+            self._openai_headers = {
+                "Authorization": f"Bearer {OPENAI_API_KEY}",
+                "Content-Type": "application/json"
+            }
+        payload = dict(_OPENAI_DICT_PAYLOAD)
+        payload["messages"] = [
+            _OPENAI_DICT_SYSTEM_MESSAGE,
+            {"role": "user", "content": f"Word: {word}\nReturn only the JSON object, no extra text."}
+        ]
 
         try:
-            resp = requests.post(url, headers=headers, json=payload, timeout=15)
-            print(f"OpenAI dictionary status: {resp.status_code}")
-            if resp.status_code != 200:
-                print(f"OpenAI error: {resp.text}")
-                return None
-            data = resp.json()
-            content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
+            with self._session.post(_OPENAI_CHAT_URL, headers=self._openai_headers, json=payload,
+                                    stream=True, timeout=(3, 6)) as resp:
+                log.debug("OpenAI dictionary status: %s", resp.status_code)
+                if resp.status_code != 200:
+                    log.warning("OpenAI error: %s", resp.text)
+                    return None
+                parts = []
+                phonetic_shown = False
+                for line in resp.iter_lines():
+                    if not line.startswith(b'data: '):
+                        continue
+                    data = line[6:]
+                    if data == b'[DONE]':
+                        break
+                    choices = loads_json(data).get('choices') or [{}]
+                    delta = choices[0].get('delta', {}).get('content')
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    if not phonetic_shown and seq is not None:
+                        match = _PARTIAL_PHONETIC_RE.search(''.join(parts))
+                        if match:
+                            phonetic_shown = True
+                            phonetic = loads_json(f'"{match.group(1)}"')
+                            self._post_ui(seq, lambda: self._show_phonetic(word, phonetic))
+            content = ''.join(parts)
             if not content:
                 return None
-            print("=== OPENAI DICTIONARY JSON ===")
-            print(content)
-            print("=== END OPENAI JSON ===")
+            log.debug("OpenAI dictionary JSON: %s", content)
             try:
-                parsed = json.loads(content)
-            except Exception as e:
-                print(f"Failed to parse OpenAI JSON: {e}")
-                return None
-
-            # Map OpenAI JSON to our expected entry format
-            entry = {
-                'phonetic': parsed.get('phonetic', ''),
-                'phonetics': [],
-                'meanings': [],
-                'similarWords': parsed.get('similarWords', {})
-            }
-            for m in parsed.get('meanings', [])[:3]:
-                pos = m.get('partOfSpeech', '')
-                defs = m.get('definitions', [])
-                # Normalize definitions into list of {definition: ...}
-                norm_defs = []
-                for d in defs[:2]:
-                    if isinstance(d, dict) and 'definition' in d:
-                        norm_defs.append({'definition': d['definition']})
-                    elif isinstance(d, str):
-                        norm_defs.append({'definition': d})
-                entry['meanings'].append({
-                    'partOfSpeech': pos,
-                    'definitions': norm_defs
-                })
+                parsed = loads_json(content)
+            except ValueError as e:
+                match = _JSON_BLOCK.search(content)
+                try:
+                    parsed = loads_json(match.group(0)) if match else None
+                except ValueError:
+                    parsed = None
+                if parsed is None:
+                    log.warning("Failed to parse OpenAI JSON: %s", e)
+                    return None
 
+            entry = _normalize_entry(parsed)
             if entry['meanings']:
-                print(f"OpenAI dictionary returning entry: {entry}")
+                log.debug("OpenAI dictionary returning entry: %s", entry)
                 return entry
             else:
-                print("OpenAI dictionary returned empty meanings")
+                log.debug("OpenAI dictionary returned empty meanings")
                 return None
         except Exception as e:
-            print(f"OpenAI dictionary request failed: {e}")
+            log.warning("OpenAI dictionary request failed: %s", e)
             return None
     
-    def _try_translation_api(self, word):
+    def _try_translation_api(self, word, seq):
         """Try a simple translation API as fallback"""
-        import requests
-        
         try:
-            print(f"Trying translation for German word: '{word}'")
+            log.debug("Trying translation for German word: '%s'", word)
             
             # Try LibreTranslate (free translation service)
             url = "https://libretranslate.de/translate"
@@ -1124,261 +1430,220 @@ class WordDefinitionPanel(QFrame):
                 'format': 'text'
             }
             
-            response = requests.post(url, data=data, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            })
+            response = self._session.post(url, data=data, timeout=10)
             
-            print(f"Translation response status: {response.status_code}")
-            print(f"Translation response text: {response.text}")
+            log.debug("Translation response status: %s", response.status_code)
+            log.debug("Translation response text: %s", response.text)
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
-                    print("=== TRANSLATION API RESPONSE STRUCTURE ===")
-                    print(f"Word: {word}")
-                    print(f"Full response: {result}")
-                    print("=== END TRANSLATION RESPONSE ===")
+                    result = loads_json(response.content)
+                    log.debug("Translation API response for '%s': %r", word, result)
                     if 'translatedText' in result:
                         translation = result['translatedText']
-                        print(f"Translation found for '{word}': {translation}")
-                        self._update_with_translation(word, translation)
+                        log.debug("Translation found for '%s': %s", word, translation)
+                        self._update_with_translation(word, translation, seq)
                         # Chain: try to fetch English definitions for the translated word
-                        self._lookup_english_definitions_and_update(translation)
+                        self._lookup_english_definitions_and_update(translation, seq)
                         return
                 except Exception as json_error:
-                    print(f"JSON parsing error: {json_error}")
-                    print(f"Raw response: {response.text}")
+                    log.warning("JSON parsing error: %s", json_error)
+                    log.debug("Raw response: %s", response.text)
         except Exception as e:
-            print(f"Translation API error: {e}")
+            log.warning("Translation API error: %s", e)
         
         # Final fallback
-        print(f"All APIs failed for word: '{word}', using fallback")
-        self._update_with_fallback(word)
+        log.warning("All APIs failed for word: '%s', using fallback", word)
+        self._update_with_fallback(word, seq)
 
-    def _lookup_english_definitions_and_update(self, english_word):
+    def _lookup_english_definitions_and_update(self, english_word, seq):
         """Fetch definitions for an English word and update UI (runs in background)."""
-        import threading
-        import requests
 
         def do_fetch():
             try:
-                url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{english_word.lower()}"
-                print(f"Chained EN lookup: {url}")
-                r = requests.get(url, timeout=8, headers={
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
-                })
-                if r.status_code == 200:
-                    data = r.json()
-                    if data:
-                        entry = data[0]
-                        from PyQt5.QtCore import QTimer
-                        QTimer.singleShot(0, lambda: self._update_with_api_data(english_word, entry))
-                        return
-                print(f"Chained EN lookup failed with status {r.status_code}")
+                log.debug("Chained EN lookup: %s", english_word)
+                entry = _normalize_entry(self._try_dictionaryapi_en(english_word))
+                if entry:
+                    self._cache_definition(english_word.lower(), entry)
+                    self._post_ui(seq, lambda: self._update_with_api_data(english_word, entry))
+                    return
+                log.debug("Chained EN lookup found nothing")
             except Exception as e:
-                print(f"Chained EN lookup error: {e}")
+                log.warning("Chained EN lookup error: %s", e)
 
-        threading.Thread(target=do_fetch, daemon=True).start()
+        EXECUTOR.submit(do_fetch)
     
     def _update_with_api_data(self, word, entry):
-        """Update panel with API data"""
-        print(f"Processing API data for word: {word}")
-        print(f"Entry structure: {entry}")
-        print(f"Entry type: {type(entry)}")
-        
-        # Get phonetic - try both 'phonetic' and 'phonetics'
-        phonetic = ""
-        if 'phonetic' in entry and entry['phonetic']:
-            phonetic = entry['phonetic']
-        elif 'phonetics' in entry and entry['phonetics']:
-            for ph in entry['phonetics']:
-                if 'text' in ph and ph['text']:
-                    phonetic = ph['text']
-                    break
-        
-        print(f"Found phonetic: {phonetic}")
-        
-        # Get meanings - handle all parts of speech
-        meanings = entry.get('meanings', [])
-        all_definitions = []
-        
-        print(f"Found {len(meanings)} meanings")
-        
-        for meaning in meanings:
-            part_of_speech = meaning.get('partOfSpeech', '').lower()
-            definitions = meaning.get('definitions', [])
-            
-            print(f"Processing {part_of_speech} with {len(definitions)} definitions")
-            
-            for def_item in definitions[:2]:  # Take first 2 definitions per part of speech
-                definition = def_item.get('definition', '')
-                if definition:
-                    all_definitions.append({
-                        'part_of_speech': part_of_speech,
-                        'definition': definition
-                    })
-                    print(f"Added definition: {part_of_speech} - {definition[:50]}...")
-        
-        print(f"Total definitions collected: {len(all_definitions)}")
-        
-        # Get similar words
-        similar_words = entry.get('similarWords', {})
-        english_similar = similar_words.get('english', [])
-        german_similar = similar_words.get('german', [])
-        print(f"Similar words - English: {english_similar}, German: {german_similar}")
+        """Update panel with API data (GUI thread; callers cache the entry beforehand)"""
+        log.debug("Processing API data for word: %s", word)
+        log.debug("Entry structure: %r", entry)
+        log.debug("Entry type: %s", type(entry))
+        
+        # Entries arrive normalized, so the fields can be read directly
+        phonetic = entry['phonetic']
+        all_definitions = [
+            {'part_of_speech': meaning['partOfSpeech'].lower(), 'definition': d['definition']}
+            for meaning in entry['meanings']
+            for d in meaning['definitions']
+        ]
+        english_similar = entry['similarWords']['english']
+        german_similar = entry['similarWords']['german']
+        log.debug("Found phonetic: %s", phonetic)
+        log.debug("Total definitions collected: %s", len(all_definitions))
+        log.debug("Similar words - English: %s, German: %s", english_similar, german_similar)
         
         # Update UI directly
-        print(f"Calling UI update for word: {word}")
+        log.debug("Calling UI update for word: %s", word)
         self._update_ui_with_api_data(word, phonetic, all_definitions, english_similar, german_similar)
     
     def _update_ui_with_api_data(self, word, phonetic, all_definitions, english_similar=None, german_similar=None):
         """Update UI with API data"""
-        print(f"Updating UI for word: {word}")
-        print(f"Phonetic: {phonetic}")
-        print(f"Definitions count: {len(all_definitions)}")
-        print(f"Similar words - English: {english_similar}, German: {german_similar}")
-        
-        # Update word label styling and show elements
-        self.word_label.setText(word)
-        self.word_label.setStyleSheet("""
-            QLabel {
-                color: black;
-                font-size: 28px;
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-        """)
-        
-        # Show star icon
-        self.star_icon.setVisible(True)
-        
-        # Format phonetic with slashes if not already present
-        if phonetic:
-            if not phonetic.startswith('/'):
-                phonetic = f"/{phonetic}"
-            if not phonetic.endswith('/'):
-                phonetic = f"{phonetic}/"
-        else:
-            phonetic = f"/{word.lower()}/"
-        self.phonetic.setText(phonetic)
-        self.phonetic.setVisible(True)
-        
-        # Show separator
-        self.separator.setVisible(True)
-        
-        # Display definitions based on part of speech
-        if all_definitions:
-            print("Updating definitions in UI...")
+        self.setUpdatesEnabled(False)  # One layout and repaint for the whole update
+        try:
+            log.debug("Updating UI for word: %s", word)
+            log.debug("Phonetic: %s", phonetic)
+            log.debug("Definitions count: %s", len(all_definitions))
+            log.debug("Similar words - English: %s, German: %s", english_similar, german_similar)
             
-            # Show first definition
-            first_def = all_definitions[0]
-            part_of_speech = first_def['part_of_speech'].upper()
-            definition = first_def['definition']
+            # Update word label styling and show elements
+            self.word_label.setText(word)
+            self._set_word_label_state('loaded')
             
-            # Show definition sections
-            self.adj_label.setVisible(True)
-            self.adj_def1.setVisible(True)
-            self.adj_def2.setVisible(True)
+            # Show star icon
+            self.star_icon.setVisible(True)
             
-            # Update the part of speech label dynamically
-            self.adj_label.setText(part_of_speech)
-            print(f"Updated part of speech label to: {part_of_speech}")
+            self._show_phonetic(word, phonetic)
             
-            print(f"Setting first definition: {definition[:50]}...")
-            self.adj_def1.setText(f"• {definition}")
+            # Show separator
+            self.separator.setVisible(True)
             
-            # Show second definition if available
-            if len(all_definitions) > 1:
-                second_def = all_definitions[1]
-                definition2 = second_def['definition']
-                print(f"Setting second definition: {definition2[:50]}...")
-                self.adj_def2.setText(f"• {definition2}")
-            else:
-                print("No second definition")
-                self.adj_def2.setText("")
+            # Display definitions based on part of speech
+            if all_definitions:
+                log.debug("Updating definitions in UI...")
             
-            # Show third definition in adverb field if available
-            if len(all_definitions) > 2:
-                third_def = all_definitions[2]
-                definition3 = third_def['definition']
-                print(f"Setting third definition: {definition3[:50]}...")
-                self.adv_def.setText(f"• {definition3}")
-            else:
-                print("No third definition")
-                self.adv_def.setText("")
+                # Show first definition
+                first_def = all_definitions[0]
+                part_of_speech = first_def['part_of_speech'].upper()
+                definition = first_def['definition']
+            
+                # Show definition sections
+                self.adj_label.setVisible(True)
+                self.adj_def1.setVisible(True)
+                self.adj_def2.setVisible(True)
+            
+                # Update the part of speech label dynamically
+                self.adj_label.setText(part_of_speech)
+                log.debug("Updated part of speech label to: %s", part_of_speech)
+            
+                log.debug("Setting first definition: %s...", definition[:50])
+                self.adj_def1.setText(f"• {definition}")
+            
+                # Show second definition if available
+                if len(all_definitions) > 1:
+                    second_def = all_definitions[1]
+                    definition2 = second_def['definition']
+                    log.debug("Setting second definition: %s...", definition2[:50])
+                    self.adj_def2.setText(f"• {definition2}")
+                else:
+                    log.debug("No second definition")
+                    self.adj_def2.setText("")
             
-            # Display similar words if available
-            if english_similar or german_similar:
-                print("Displaying similar words...")
-                similar_text = ""
-                if english_similar:
-                    similar_text += f"English: {', '.join(english_similar[:3])}\n"
-                if german_similar:
-                    similar_text += f"German: {', '.join(german_similar[:3])}"
+                # Show third definition in adverb field if available
+                if len(all_definitions) > 2:
+                    third_def = all_definitions[2]
+                    definition3 = third_def['definition']
+                    log.debug("Setting third definition: %s...", definition3[:50])
+                    self.adv_def.setText(f"• {definition3}")
+                else:
+                    log.debug("No third definition")
+                    self.adv_def.setText("")
+            
+                # Display similar words if available
+                if english_similar or german_similar:
+                    log.debug("Displaying similar words...")
+                    similar_text = ""
+                    if english_similar:
+                        similar_text += f"English: {', '.join(english_similar[:3])}\n"
+                    if german_similar:
+                        similar_text += f"German: {', '.join(german_similar[:3])}"
                 
-                # Show the adverb label and similar words with separator
-                self.adv_label.setText("SIMILAR WORDS")
-                self.adv_def.setText(similar_text.strip())
-                self.adv_label.setVisible(True)
-                self.adv_def.setVisible(True)
-                print(f"Set similar words: {similar_text.strip()}")
+                    # Show the adverb label and similar words with separator
+                    self.adv_label.setText("SIMILAR WORDS")
+                    self.adv_def.setText(similar_text.strip())
+                    self.adv_label.setVisible(True)
+                    self.adv_def.setVisible(True)
+                    log.debug("Set similar words: %s", similar_text.strip())
+                else:
+                    # Hide adverb section if no similar words
+                    self.adv_label.setVisible(False)
+                    self.adv_def.setVisible(False)
+                    log.debug("No similar words, hiding adverb section")
             else:
-                # Hide adverb section if no similar words
+                log.debug("No definitions found, setting fallback text")
+                # Show definition sections even for fallback
+                self.adj_label.setVisible(True)
+                self.adj_def1.setVisible(True)
+                self.adj_def2.setVisible(False)
+                self.adj_label.setText("NOUN")  # Default fallback
+                self.adj_def1.setText("No definition found")
+                self.adj_def2.setText("")
                 self.adv_label.setVisible(False)
                 self.adv_def.setVisible(False)
-                print("No similar words, hiding adverb section")
-        else:
-            print("No definitions found, setting fallback text")
-            # Show definition sections even for fallback
-            self.adj_label.setVisible(True)
-            self.adj_def1.setVisible(True)
-            self.adj_def2.setVisible(False)
-            self.adj_label.setText("NOUN")  # Default fallback
-            self.adj_def1.setText("No definition found")
-            self.adj_def2.setText("")
-            self.adv_label.setVisible(False)
-            self.adv_def.setVisible(False)
-        
-        print("UI update completed")
+            
+            log.debug("UI update completed")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+    
+    def _show_phonetic(self, word, phonetic):
+        """Show the pronunciation, formatted with slashes if not already present"""
+        phonetic = _IPA_CLEAN.sub('', phonetic).strip() if phonetic else ''
+        phonetic = f"/{phonetic or word.lower()}/"
+        self.phonetic.setText(phonetic)
+        self.phonetic.setVisible(True)
     
-    def _update_with_translation(self, word, translation):
+    def _update_with_translation(self, word, translation, seq):
         """Update panel with translation data"""
-        from PyQt5.QtCore import QTimer
-        QTimer.singleShot(0, lambda: self._update_ui_with_translation(word, translation))
+        self._post_ui(seq, lambda: self._update_ui_with_translation(word, translation))
     
     def _update_ui_with_translation(self, word, translation):
         """Update UI with translation data"""
-        self.word_label.setText(word)
-        self.phonetic.setText(f"/{word.lower()}/")
-        self.adj_def1.setText(f"Translation: {translation}")
-        self.adj_def2.setText("(German to English translation)")
-        self.adv_def.setText("")
+        self._show_plain_entry(word, "TRANSLATION", f"Translation: {translation}",
+                               "(German to English translation)")
     
-    def _update_with_fallback(self, word):
+    def _show_plain_entry(self, word, heading, line1, line2):
+        """Show a one-section entry, resetting every label a loading state or earlier word set"""
+        self.setUpdatesEnabled(False)  # One layout and repaint for the whole update
+        try:
+            self.word_label.setText(word)
+            self._set_word_label_state('loaded')
+            self.star_icon.setVisible(True)
+            self._show_phonetic(word, '')
+            self.separator.setVisible(True)
+            
+            self.adj_label.setText(heading)
+            self.adj_def1.setText(line1)
+            self.adj_def2.setText(line2)
+            self.adj_label.setVisible(True)
+            self.adj_def1.setVisible(True)
+            self.adj_def2.setVisible(True)
+            
+            self.adv_def.setText("")
+            self.adv_label.setVisible(False)
+            self.adv_def.setVisible(False)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+    
+    def _update_with_fallback(self, word, seq):
         """Update panel with fallback data"""
-        from PyQt5.QtCore import QTimer
-        QTimer.singleShot(0, lambda: self._update_ui_with_fallback(word))
+        self._post_ui(seq, lambda: self._update_ui_with_fallback(word))
     
     def _update_ui_with_fallback(self, word):
         """Update UI with fallback data"""
-        self.word_label.setText(word)
-        self.phonetic.setText(f"/{word.lower()}/")
-        
-        # Provide some basic German word information
-        # Fallback display when no API data is available
-        self.adj_def1.setText(f"Word: {word}")
-        self.adj_def2.setText("(No definition available)")
-        if word_lower in german_words:
-            self.adj_def1.setText(f"German: {german_words[word_lower]}")
-            self.adj_def2.setText("(Basic German translation)")
-        else:
-            self.adj_def1.setText(f"Word: {word}")
-            self.adj_def2.setText("(No definition available)")
-        
-        self.adv_def.setText("")
+        # Fallback display when no API data is available; GERMAN_FALLBACK words never
+        # get here, lookup_word_definition shows them as translations up front
+        self._show_plain_entry(word, "UNKNOWN", f"Word: {word}", "(No definition available)")
 
 class TranscriberApp(QWidget):
     def __init__(self):
@@ -1434,6 +1699,16 @@ class TranscriberApp(QWidget):
         self.audio_transcriber = AudioTranscriber()
         self.audio_transcriber.transcription_updated.connect(self.on_transcription_updated)
         self.audio_transcriber.status_updated.connect(self.on_status_updated)
+        
+        # In-progress sentence updates are coalesced and drawn at most every 50 ms
+        self._pending_current = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_current)
+        
+        # Get DNS and TLS out of the way before the first word click
+        EXECUTOR.submit(self.word_panel.warm_connections)
 
     def createTranscribeTab(self):
         # Main content area
@@ -1465,71 +1740,46 @@ class TranscriberApp(QWidget):
             self.audio_transcriber.start_listening()
             self._update_button_to_stop()
     
+    def _set_play_button_state(self, state, text):
+        """Switch the play button between its play and stop styles"""
+        button = self.text_display.play_button
+        if button.property('state') == state:
+            return
+        button.setText(text)
+        button.setProperty('state', state)
+        # Re-resolve the [state=...] rules without reparsing the stylesheet
+        button.style().unpolish(button)
+        button.style().polish(button)
+    
     def _update_button_to_play(self):
         """Update button to play state"""
-        self.text_display.play_button.setText("▶")
-        self.text_display.play_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.2);
-                color: white;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 30px;
-                width: 60px;
-                height: 60px;
-                font-size: 24px;
-                font-weight: bold;
-                outline: none;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.3);
-                border: 2px solid rgba(255, 255, 255, 0.5);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.4);
-            }
-            QPushButton:focus {
-                outline: none;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-        """)
+        self._set_play_button_state('play', "▶")
     
     def _update_button_to_stop(self):
         """Update button to stop state"""
-        self.text_display.play_button.setText("⏹")
-        self.text_display.play_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 0, 0, 0.3);
-                color: white;
-                border: 2px solid rgba(255, 0, 0, 0.5);
-                border-radius: 30px;
-                width: 60px;
-                height: 60px;
-                font-size: 24px;
-                font-weight: bold;
-                outline: none;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 0, 0, 0.4);
-                border: 2px solid rgba(255, 0, 0, 0.6);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 0, 0, 0.5);
-            }
-            QPushButton:focus {
-                outline: none;
-                border: 2px solid rgba(255, 0, 0, 0.5);
-            }
-        """)
+        self._set_play_button_state('stop', "⏹")
     
-    def on_transcription_updated(self, text):
+    def on_transcription_updated(self, completed, current):
         """Handle transcription updates from the audio transcriber"""
-        if text.startswith("CURRENT:"):
-            # This is the current sentence being transcribed
-            current_text = text[8:]  # Remove "CURRENT:" prefix
-            self.text_display.update_current_sentence(current_text)
-        else:
-            # This is a completed sentence
-            self.text_display.add_sentence(text)
+        if completed:
+            # Completed sentences are drawn at once and replace any pending current text
+            self._pending_current = None
+            self._flush_timer.stop()
+            for sentence in completed:
+                self.text_display.add_sentence(sentence)
+            # Look up likely clicks while the user is still reading
+            self.word_panel.prefetch(_PREFETCH_WORD_RE.findall(' '.join(completed)))
+        if current:
+            # This is the current sentence being transcribed; only the latest is drawn
+            self._pending_current = current
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+    
+    def _flush_current(self):
+        """Draw the latest in-progress sentence"""
+        if self._pending_current is not None:
+            self.text_display.update_current_sentence(self._pending_current)
+            self._pending_current = None
     
     def on_status_updated(self, status):
         self.text_display.update_status(status)
@@ -1543,15 +1793,24 @@ class TranscriberApp(QWidget):
         """Handle word clicks to show definitions"""
         print(f"Showing definition for: {word}")
         if hasattr(self, 'word_panel') and self.word_panel is not None:
-            # Show word immediately with loading state
-            self.word_panel.show_word_loading(word)
-            # Then fetch definition
+            # Shows the word at once, with a loading state on a cache miss
             self.word_panel.update_word(word)
         else:
             print("Word panel not available yet")
 
 if __name__ == '__main__':
+    # Records are written by a listener thread, so logging from the PortAudio
+    # callback never blocks on stderr
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    log_listener.start()
     app = QApplication(sys.argv)
     transcriber = TranscriberApp()
     transcriber.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    exit_code = app.exec_()
+    log_listener.stop()
+    sys.exit(exit_code)
\ No newline at end of file
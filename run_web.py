@@ -18,7 +18,7 @@ if not os.getenv('OPENAI_API_KEY'):
     sys.exit(1)
 
 # Import and run the Flask app
-from app import app
+from app import app, CFG
 
 if __name__ == '__main__':
     print("🎙️ Starting Podcast Transcriber Web Application...")
@@ -26,7 +26,4 @@ if __name__ == '__main__':
     print("🔑 API Key loaded successfully")
     
     # Run the application
-    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
-    port = int(os.environ.get('PORT', 5000))
-    
-    app.run(host='0.0.0.0', port=port, debug=debug_mode)
+    app.run(host='0.0.0.0', port=CFG.port, debug=CFG.debug)
@@ -0,0 +1,116 @@
+"""
+Audio Buffers - Preallocated sample storage shared between audio threads
+"""
+
+import collections
+from array import array
+
+import numpy as np
+
+class AudioRingBuffer:
+    """Single-producer/single-consumer ring buffer of float32 samples"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer = np.empty(capacity, dtype=np.float32)
+        # Monotonic [head, tail] sample counters. The consumer only stores head and
+        # the producer only stores tail; a single slot store is atomic under the GIL,
+        # so neither side needs a lock.
+        self._indices = array('Q', [0, 0])
+
+    def __len__(self) -> int:
+        head, tail = self._indices
+        return min(tail - head, self.capacity)
+
+    def write(self, frames: np.ndarray):
+        """Append samples (producer side)"""
+        n = len(frames)
+        if n > self.capacity:
+            frames = frames[-self.capacity:]
+            n = self.capacity
+
+        tail = self._indices[1]
+        start = tail % self.capacity
+        first = min(n, self.capacity - start)
+        self._buffer[start:start + first] = frames[:first]
+        if first < n:
+            self._buffer[:n - first] = frames[first:]
+
+        # Publish only after the samples are in place
+        self._indices[1] = tail + n
+
+    def latest(self, n: int) -> np.ndarray:
+        """Return (a copy of) the most recent n samples without consuming them"""
+        tail = self._indices[1]
+        n = min(n, len(self))
+        start = (tail - n) % self.capacity
+        if start + n <= self.capacity:
+            return self._buffer[start:start + n].copy()
+        return np.concatenate((self._buffer[start:], self._buffer[:start + n - self.capacity]))
+
+    def mean_square(self, n: int) -> float:
+        """Mean square of the most recent n samples, computed in place without copying"""
+        tail = self._indices[1]
+        n = min(n, len(self))
+        if n == 0:
+            return 0.0
+        start = (tail - n) % self.capacity
+        first = min(n, self.capacity - start)
+        view = self._buffer[start:start + first]
+        total = float(np.dot(view, view))
+        if first < n:
+            view = self._buffer[:n - first]
+            total += float(np.dot(view, view))
+        return total / n
+
+    def read_into(self, out: np.ndarray, keep: int = 0) -> int:
+        """Copy all unread samples into out, leaving the last `keep` samples unread"""
+        head, tail = self._indices
+        if tail - head > self.capacity:
+            # Producer lapped us; the oldest samples are gone
+            head = tail - self.capacity
+        n = tail - head
+
+        start = head % self.capacity
+        first = min(n, self.capacity - start)
+        np.copyto(out[:first], self._buffer[start:start + first])
+        if first < n:
+            np.copyto(out[first:n], self._buffer[:n - first])
+
+        self._indices[0] = tail - min(keep, n)
+        return n
+
+    def clear(self):
+        """Discard all unread samples (consumer side)"""
+        self._indices[0] = self._indices[1]
+
+class Float32Pool:
+    """Free list of fixed-size float32 buffers for handing audio chunks between threads"""
+
+    dtype = np.float32
+
+    def __init__(self, size: int, max_buffers: int = 8):
+        self._size = size
+        self._max_buffers = max_buffers
+        self._free = collections.deque()
+
+    def acquire(self, n: int) -> np.ndarray:
+        """Borrow a buffer of n samples; sizes above the pool size get a plain array"""
+        if n > self._size:
+            return np.empty(n, dtype=self.dtype)
+        try:
+            buf = self._free.pop()
+        except IndexError:
+            buf = np.empty(self._size, dtype=self.dtype)
+        return buf[:n]
+
+    def release(self, buf: np.ndarray):
+        """Return a buffer obtained from acquire()"""
+        root = buf if buf.base is None else buf.base
+        if root.shape == (self._size,) and root.dtype == self.dtype and len(self._free) < self._max_buffers:
+            self._free.append(root)
+
+class Int16Pool(Float32Pool):
+    """Free list of fixed-size int16 buffers for PCM encoding"""
+
+    dtype = np.int16
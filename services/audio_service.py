@@ -3,161 +3,190 @@ Audio Service - Handles audio recording and processing
 """
 
 import os
+import logging
 import threading
 import queue
-import tempfile
-import wave
-import time
 from typing import Dict, Any, Optional
 
 import numpy as np
 import sounddevice as sd
 
+from .audio_buffers import AudioRingBuffer, Float32Pool
+
+# Optional voice activity detector; without it every flushed chunk is transcribed
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+# Child of the app's 'transcription' logger, whose QueueHandler keeps stream writes
+# off the PortAudio callback thread
+log = logging.getLogger('transcription.audio')
+
+VAD_FRAME = 480  # webrtcvad accepts 10/20/30 ms frames; 30 ms at 16 kHz
+
+def _parse_latency(value: str):
+    """PortAudio latency: 'low'/'high' or a number of seconds"""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
 class AudioService:
     """Service for handling audio recording and processing"""
     
-    def __init__(self):
+    def __init__(self, max_queue: int = 4):
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
-        self.audio_threads: Dict[str, threading.Thread] = {}
-        self.audio_queues: Dict[str, queue.Queue] = {}
+        
+        # One input stream feeds every session; open only while a session is recording
+        self._stream: Optional[sd.InputStream] = None
+        self._stream_lock = threading.Lock()
+        
+        # Shared hand-off to the transcription worker: (session_id, data, sample_rate)
+        # tuples, or None to signal shutdown. Bounded so a slow
+        # Whisper falls behind by at most max_queue chunks; the oldest are dropped
+        self.chunk_queue: queue.Queue = queue.Queue(maxsize=max_queue)
         
         # Audio settings
         self.sample_rate = 16000
         self.channels = 1
-        self.chunk_duration = 0.1  # 100ms chunks
+        # Block size 0 lets PortAudio deliver whatever the device buffer holds; with
+        # latency 'low' that is the smallest buffer it considers safe
+        self.blocksize = int(os.getenv('AUDIO_BLOCKSIZE', '0'))
+        self.latency = _parse_latency(os.getenv('AUDIO_LATENCY', 'low'))
         self.silence_threshold = 0.01
         self.min_silence_duration = 1.5  # seconds
         self.max_buffer_duration = 8  # seconds
+        self.ring_duration = 30  # seconds of audio each session can hold
+        
+        # Chunks with no voiced frame are dropped instead of sent to Whisper, where
+        # hum above the RMS threshold would cost a request and invite hallucinations
+        self.vad = webrtcvad.Vad(2) if WEBRTCVAD_AVAILABLE else None
+        
+        # Chunks handed to the worker are borrowed from this pool and released
+        # once transcribed; a flush never exceeds max_buffer_duration plus one block
+        self.chunk_pool = Float32Pool(self.sample_rate * (self.max_buffer_duration + 1))
         
     def start_recording(self, session_id: str) -> bool:
         """Start audio recording for a session"""
         try:
             if session_id in self.active_sessions:
-                print(f"Session {session_id} already recording")
+                log.info("Session %s already recording", session_id)
                 return True
             
             # Initialize session
             self.active_sessions[session_id] = {
                 'is_recording': True,
-                'audio_buffer': [],
+                'audio_buffer': AudioRingBuffer(self.sample_rate * self.ring_duration),
                 'silence_duration': 0,
                 'last_audio_time': 0,
-                'last_processing_time': 0
+                'last_processing_time': 0,
+                'chunk_count': 0,
+                'sample_count': 0
             }
             
-            # Create audio queue for this session
-            self.audio_queues[session_id] = queue.Queue()
+            # The first session opens the shared input stream
+            with self._stream_lock:
+                if self._stream is None:
+                    self._stream = self._open_stream()
             
-            # Start audio recording thread
-            audio_thread = threading.Thread(
-                target=self._record_audio,
-                args=(session_id,),
-                daemon=True
-            )
-            self.audio_threads[session_id] = audio_thread
-            audio_thread.start()
-            
-            print(f"Started recording for session {session_id}")
+            log.info("Started recording for session %s", session_id)
             return True
             
         except Exception as e:
-            print(f"Error starting recording for session {session_id}: {e}")
+            self.active_sessions.pop(session_id, None)
+            log.error("Error starting recording for session %s: %s", session_id, e)
             return False
     
     def stop_recording(self, session_id: str) -> bool:
         """Stop audio recording for a session"""
         try:
             if session_id not in self.active_sessions:
-                print(f"Session {session_id} not found")
+                log.warning("Session %s not found", session_id)
                 return False
             
-            # Stop recording
+            # Stop recording, then clean up the session
             self.active_sessions[session_id]['is_recording'] = False
+            del self.active_sessions[session_id]
             
-            # Wait for audio thread to finish
-            if session_id in self.audio_threads:
-                self.audio_threads[session_id].join(timeout=2.0)
-                del self.audio_threads[session_id]
+            # The last session closes the shared input stream
+            with self._stream_lock:
+                if not self.active_sessions and self._stream is not None:
+                    self._stream.close()
+                    self._stream = None
             
-            # Clean up session
-            if session_id in self.active_sessions:
-                del self.active_sessions[session_id]
-            
-            if session_id in self.audio_queues:
-                del self.audio_queues[session_id]
-            
-            print(f"Stopped recording for session {session_id}")
+            log.info("Stopped recording for session %s", session_id)
             return True
             
         except Exception as e:
-            print(f"Error stopping recording for session {session_id}: {e}")
+            log.error("Error stopping recording for session %s: %s", session_id, e)
             return False
     
-    def _record_audio(self, session_id: str):
-        """Audio recording thread function"""
+    def _open_stream(self) -> sd.InputStream:
+        """Open and start the input stream shared by all sessions"""
+        # PortAudio delivers each block to the callback, which copies it straight
+        # into every recording session's ring
+        stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype=np.float32,
+            device=None,
+            blocksize=self.blocksize,
+            latency=self.latency,
+            callback=self._on_audio
+        )
+        stream.start()
+        log.info("Audio input stream started (latency %.0f ms)", stream.latency * 1000)
+        return stream
+    
+    def _on_audio(self, indata: np.ndarray, frames: int, time_info, status):
+        """Broadcast one captured block to every session (runs on the PortAudio thread)"""
+        for session_id, session in list(self.active_sessions.items()):
+            self._on_audio_block(session_id, session, indata)
+    
+    def _on_audio_block(self, session_id: str, session: Dict[str, Any], indata: np.ndarray):
+        """Handle one block of captured audio (runs on the PortAudio thread)"""
         try:
-            print(f"Starting audio recording thread for session {session_id}")
+            if not session['is_recording']:
+                return
+            
+            block = indata[:, 0]
+            session['audio_buffer'].write(block)
+            session['chunk_count'] += 1
+            session['sample_count'] += len(block)
             
-            with sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.float32,
-                device=None,
-                blocksize=int(self.sample_rate * self.chunk_duration)
-            ) as stream:
-                chunk_count = 0
+            # Calculate current time; blocks vary in size, so count samples
+            current_time = session['sample_count'] / self.sample_rate
+            
+            # Check if we should process audio
+            if self._should_process_audio(session, block, current_time):
+                log.debug("Processing audio chunk %d for session %s", session['chunk_count'], session_id)
+                self._process_audio_chunk(session_id, session)
+                session['last_processing_time'] = current_time
                 
-                while (session_id in self.active_sessions and 
-                       self.active_sessions[session_id]['is_recording']):
-                    try:
-                        # Record audio chunk
-                        audio_chunk, _ = stream.read(int(self.sample_rate * self.chunk_duration))
-                        self.active_sessions[session_id]['audio_buffer'].extend(audio_chunk.flatten())
-                        chunk_count += 1
-                        
-                        # Calculate current time
-                        current_time = chunk_count * self.chunk_duration
-                        
-                        # Check if we should process audio
-                        if self._should_process_audio(session_id, current_time):
-                            print(f"Processing audio chunk {chunk_count} for session {session_id}")
-                            self._process_audio_chunk(session_id)
-                            self.active_sessions[session_id]['last_processing_time'] = current_time
-                            
-                    except Exception as e:
-                        print(f"Audio recording error for session {session_id}: {e}")
-                        break
-                        
         except Exception as e:
-            print(f"Audio setup error for session {session_id}: {e}")
-        finally:
-            print(f"Audio recording thread ended for session {session_id}")
+            log.error("Audio recording error for session %s: %s", session_id, e)
     
-    def _should_process_audio(self, session_id: str, current_time: float) -> bool:
+    def _should_process_audio(self, session: Dict[str, Any], block: np.ndarray, current_time: float) -> bool:
         """Determine if audio should be processed based on silence detection"""
-        if session_id not in self.active_sessions:
-            return False
-        
-        session = self.active_sessions[session_id]
         audio_buffer = session['audio_buffer']
         
-        if not audio_buffer:
-            return False
-        
-        # Calculate audio volume (RMS) from last 0.5 seconds
-        recent_samples = int(self.sample_rate * 0.5)
-        audio_array = np.array(audio_buffer[-recent_samples:]) if len(audio_buffer) >= recent_samples else np.array(audio_buffer)
-        
-        if len(audio_array) == 0:
+        if len(audio_buffer) == 0:
             return False
         
-        rms_volume = np.sqrt(np.mean(audio_array**2))
-        
-        # Check for silence
-        is_silent = rms_volume < self.silence_threshold
+        # Fast path: already in silence and the new block stays well under the threshold,
+        # so the 0.5 s window cannot have turned loud; skip the RMS over the window
+        if session['silence_duration'] > 0 and np.abs(block).max() < self.silence_threshold * 0.5:
+            is_silent = True
+        else:
+            # Calculate audio volume (RMS) from last 0.5 seconds, straight off the ring
+            recent_samples = int(self.sample_rate * 0.5)
+            rms_volume = np.sqrt(audio_buffer.mean_square(recent_samples))
+            is_silent = rms_volume < self.silence_threshold
         
         if is_silent:
-            session['silence_duration'] += self.chunk_duration
+            session['silence_duration'] += len(block) / self.sample_rate
         else:
             session['silence_duration'] = 0
             session['last_audio_time'] = current_time
@@ -165,48 +194,77 @@ class AudioService:
         # Decision logic:
         # 1. Send if we've had silence for min_silence_duration seconds
         if session['silence_duration'] >= self.min_silence_duration:
-            print(f"Sending due to silence: {session['silence_duration']:.1f}s")
+            log.debug("Sending due to silence: %.1fs", session['silence_duration'])
             return True
         
         # 2. Send if buffer is getting too long
         buffer_duration = len(audio_buffer) / self.sample_rate
         if buffer_duration >= self.max_buffer_duration:
-            print(f"Sending due to max buffer duration: {buffer_duration:.1f}s")
+            log.debug("Sending due to max buffer duration: %.1fs", buffer_duration)
             return True
         
         # 3. Send if we've been recording for a while without processing
         time_since_last_processing = current_time - session['last_processing_time']
         if time_since_last_processing >= 5.0:
-            print(f"Sending due to time since last processing: {time_since_last_processing:.1f}s")
+            log.debug("Sending due to time since last processing: %.1fs", time_since_last_processing)
             return True
         
         return False
     
-    def _process_audio_chunk(self, session_id: str):
+    def _process_audio_chunk(self, session_id: str, session: Dict[str, Any]):
         """Process audio chunk and send for transcription"""
         try:
-            session = self.active_sessions[session_id]
-            audio_buffer = session['audio_buffer'].copy()
+            ring = session['audio_buffer']
+            audio_buffer = self.chunk_pool.acquire(len(ring))
             
-            # Keep last 2 seconds for context
-            keep_samples = int(self.sample_rate * 2)
-            session['audio_buffer'] = audio_buffer[-keep_samples:] if len(audio_buffer) > keep_samples else []
+            # No audio is carried over; context comes from the previous text instead
+            ring.read_into(audio_buffer)
             
-            # Send audio data to queue for transcription
-            if session_id in self.audio_queues:
-                self.audio_queues[session_id].put({
-                    'type': 'audio_chunk',
-                    'data': audio_buffer,
-                    'sample_rate': self.sample_rate,
-                    'timestamp': time.time()
-                })
+            # Send audio data to the shared queue for transcription; the worker runs
+            # the VAD check, keeping it off the real-time thread
+            self._enqueue_chunk((session_id, audio_buffer, self.sample_rate))
             
         except Exception as e:
-            print(f"Error processing audio chunk for session {session_id}: {e}")
+            log.error("Error processing audio chunk for session %s: %s", session_id, e)
+    
+    def has_speech(self, audio: np.ndarray) -> bool:
+        """Whether any 30 ms frame of the chunk is voiced (always True without a VAD).
+
+        Converts the whole chunk to int16, so call it from the transcription worker,
+        never from the audio callback.
+        """
+        if self.vad is None:
+            return True
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+        frame_bytes = VAD_FRAME * 2
+        return any(
+            self.vad.is_speech(pcm[i:i + frame_bytes], self.sample_rate)
+            for i in range(0, len(pcm) - frame_bytes + 1, frame_bytes)
+        )
+    
+    def _enqueue_chunk(self, item: Optional[tuple]):
+        """Queue an item for the worker, dropping the oldest chunk if the queue is full"""
+        while True:
+            try:
+                self.chunk_queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+            try:
+                dropped = self.chunk_queue.get_nowait()
+            except queue.Empty:
+                continue
+            if dropped is not None:
+                log.warning("Transcription backlog full, dropping chunk for session %s", dropped[0])
+                self.chunk_pool.release(dropped[1])
     
-    def get_audio_queue(self, session_id: str) -> Optional[queue.Queue]:
-        """Get audio queue for a session"""
-        return self.audio_queues.get(session_id)
+    def shutdown(self):
+        """Close the input stream, then wake the transcription worker and tell it to exit"""
+        with self._stream_lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+        self._enqueue_chunk(None)
     
     def is_recording(self, session_id: str) -> bool:
         """Check if a session is currently recording"""
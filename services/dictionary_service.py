@@ -4,16 +4,100 @@ Dictionary Service - Handles word definitions and lookups
 
 import os
 import requests
-import json
+import sqlite3
+import threading
+import time
 from typing import Dict, Any, Optional
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .json_utils import dumps_json, loads_json
+
+# Persistent cache of OpenAI definitions, so repeat lookups survive restarts
+CACHE_DB_PATH = os.getenv('DICTIONARY_CACHE_DB', 'dict_cache.sqlite')
+CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+
+# Compact schema prompt; JSON mode enforces the output format, so the structure
+# is spelled out once rather than described in prose
+SYSTEM_PROMPT = (
+    "Dictionary. Return JSON: {phonetic,meanings:[{partOfSpeech,definitions:[{definition}]}],"
+    "similarWords:{english:[],german:[]}}. phonetic MUST be non-empty IPA."
+)
+
 class DictionaryService:
     """Service for handling word definitions and dictionary lookups"""
     
-    def __init__(self):
+    def __init__(self, cache_path: str = CACHE_DB_PATH):
         self.api_key = os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
+        
+        # Keep-alive connection pool shared by all lookups
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # One connection shared by the request threads, serialised by a lock
+        self._db_lock = threading.Lock()
+        self._db = self._open_cache(cache_path)
+    
+    def _open_cache(self, path: str) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the definition cache; None if unavailable"""
+        try:
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS cache (word TEXT PRIMARY KEY, json TEXT, ts REAL)')
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            print(f"Definition cache unavailable: {e}")
+            return None
+    
+    def _cache_get(self, word: str) -> Optional[Dict[str, Any]]:
+        """Return the cached definition for a word, or None"""
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute('SELECT json, ts FROM cache WHERE word = ?', (word,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Definition cache read error: {e}")
+            return None
+        if row is None or time.time() - row[1] > CACHE_TTL:
+            return None
+        return loads_json(row[0])
+    
+    def _cache_put(self, word: str, definition: Dict[str, Any]):
+        """Write a definition through to the cache"""
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO cache (word, json, ts) VALUES (?, ?, ?)',
+                    (word, dumps_json(definition).decode('utf-8'), time.time())
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Definition cache write error: {e}")
+    
+    def close(self):
+        """Close pooled HTTP connections and the definition cache"""
+        self._session.close()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
     
     def get_definition(self, word: str) -> Dict[str, Any]:
         """Get word definition using OpenAI API"""
@@ -28,14 +112,26 @@ class DictionaryService:
                     'definition': None
                 }
             
+            cached = self._cache_get(clean_word)
+            if cached is not None:
+                return {
+                    'success': True,
+                    'word': clean_word,
+                    'definition': cached
+                }
+            
             # Try OpenAI dictionary API first
             result = self._get_openai_definition(clean_word)
             if result['success']:
+                # Raw-text fallbacks are shown but not cached, so a later lookup can do better
+                if not result.get('fallback'):
+                    self._cache_put(clean_word, result['definition'])
                 return result
             
             # Fallback to basic response
             return {
                 'success': True,
+                'fallback': True,
                 'word': clean_word,
                 'definition': {
                     'phonetic': f"/{clean_word}/",
@@ -64,63 +160,49 @@ class DictionaryService:
         """Get definition using OpenAI Chat API"""
         try:
             url = "https://api.openai.com/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            system_prompt = """You are a dictionary API that provides word definitions in JSON format. 
-            For the given word, return a JSON object with the following structure:
-            {
-                "phonetic": "string with IPA pronunciation, REQUIRED - never empty",
-                "meanings": [
-                    {
-                        "partOfSpeech": "string (noun, verb, adjective, etc.)",
-                        "definitions": [
-                            {"definition": "string"}
-                        ]
-                    }
-                ],
-                "similarWords": {
-                    "english": ["word1", "word2", "word3"],
-                    "german": ["word1", "word2", "word3"]
-                }
-            }
-            
-            ALWAYS provide IPA pronunciation in phonetic field.
-            Include similar words in both English and German when relevant.
-            Provide accurate definitions and part of speech information."""
             
-            user_prompt = f"Provide a dictionary definition for the word: {word}"
+            user_prompt = f"Word: {word}"
             
             data = {
                 "model": "gpt-4o-mini",
                 "messages": [
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
+                "response_format": {"type": "json_object"},
                 "temperature": 0.3,
                 "max_tokens": 500
             }
             
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = self._session.post(url, json=data, timeout=(5, 30))
             
             if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
+                result = loads_json(response.content)
+                choice = result['choices'][0]
+                content = choice['message']['content']
+                
+                # A reply cut off at max_tokens is not valid JSON; don't pass it off as a definition
+                if choice.get('finish_reason') == 'length':
+                    return {
+                        'success': False,
+                        'error': 'OpenAI response truncated',
+                        'word': word,
+                        'definition': None
+                    }
                 
                 # Parse JSON response
                 try:
-                    definition = json.loads(content)
+                    definition = loads_json(content)
                     return {
                         'success': True,
                         'word': word,
                         'definition': definition
                     }
-                except json.JSONDecodeError:
+                except ValueError:
                     # If JSON parsing fails, return the raw content
                     return {
                         'success': True,
+                        'fallback': True,
                         'word': word,
                         'definition': {
                             'phonetic': f"/{word}/",
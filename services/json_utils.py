@@ -0,0 +1,25 @@
+"""
+JSON Utils - JSON encoding and decoding shared by the apps and services
+"""
+
+import json
+from typing import Any
+
+# Faster JSON encoding and decoding when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def loads_json(data):
+    """Decode JSON text or bytes, preferring orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json(obj: Any) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, preferring orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
@@ -3,55 +3,207 @@ Transcription Service - Handles speech-to-text conversion
 """
 
 import os
-import tempfile
-import wave
+import re
+import hashlib
+import io
+import logging
+import struct
+import threading
 import requests
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .audio_buffers import Float32Pool, Int16Pool
+from .json_utils import loads_json
+
+# Child of the app's queued 'transcription' logger; this runs on the worker threads
+log = logging.getLogger('transcription.whisper')
+
+# Opus-in-Ogg upload encoding; libsndfile builds older than 1.0.29 load but can't write Opus
+try:
+    import soundfile as sf
+    OPUS_AVAILABLE = 'OPUS' in sf.available_subtypes('OGG')
+except (ImportError, OSError):
+    OPUS_AVAILABLE = False
+
+# Sample rates the Opus encoder accepts; anything else is uploaded as WAV
+OPUS_SAMPLE_RATES = frozenset({8000, 12000, 16000, 24000, 48000})
+
+# Scratch buffers for PCM encoding cover a merged batch of live chunks; longer
+# clips fall back to one-off arrays
+PCM_POOL_SAMPLES = 16000 * 40
+
+# Shared by every TranscriptionService (and safe across worker threads), so
+# back-to-back chunks recycle the same buffers whichever instance encodes them
+_F32_POOL = Float32Pool(PCM_POOL_SAMPLES)
+_I16_POOL = Int16Pool(PCM_POOL_SAMPLES)
+
+# 44-byte RIFF/WAVE header for 16-bit mono PCM
+_WAV_HDR = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+def _wav_header(n_samples: int, sample_rate: int) -> bytes:
+    """RIFF/WAVE header for n_samples of 16-bit mono PCM"""
+    data_size = n_samples * 2
+    return _WAV_HDR.pack(b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, 1,
+                         sample_rate, sample_rate * 2, 2, 16, b'data', data_size)
+
+def _peak_abs(x: np.ndarray) -> float:
+    """Largest absolute sample, from two read-only reductions instead of an abs() temporary"""
+    return max(float(x.max()), -float(x.min()))
+
+# Whisper request parameters shared by every upload
+WHISPER_URL = "https://api.openai.com/v1/audio/transcriptions"
+_WHISPER_FIELDS = MappingProxyType({
+    'model': 'whisper-1',
+    'language': 'de',  # German
+    'response_format': 'json'
+})
+
+# Multipart framing for recorded-audio uploads; only the prompt and the WAV vary
+_FORM_BOUNDARY = 'transcriber-' + os.urandom(12).hex()
+_FORM_CONTENT_TYPE = f'multipart/form-data; boundary={_FORM_BOUNDARY}'
+
+def _form_field(name: str, value: str) -> bytes:
+    """One multipart text field"""
+    return (
+        f'--{_FORM_BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+    ).encode('utf-8')
+
+_FORM_FIELDS = b''.join(_form_field(name, value) for name, value in _WHISPER_FIELDS.items())
+_FORM_FILE_HEAD = (
+    f'--{_FORM_BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="audio.wav"\r\n'
+    'Content-Type: audio/wav\r\n\r\n'
+).encode()
+_FORM_OGG_HEAD = (
+    f'--{_FORM_BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="audio.ogg"\r\n'
+    'Content-Type: audio/ogg\r\n\r\n'
+).encode()
+_FORM_TAIL = f'\r\n--{_FORM_BOUNDARY}--\r\n'.encode()
+
+# Successful transcriptions kept by content hash, so retried or repeated audio
+# skips the API
+RESULT_CACHE_SIZE = 512
+
+# A run of text up to and including a sentence-ending mark
+_SENTENCE_RE = re.compile(r'[^.!?]*[.!?]')
 
 class TranscriptionService:
     """Service for handling speech-to-text transcription"""
     
-    def __init__(self):
+    def __init__(self, use_opus: bool = True):
         self.api_key = os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
+        
+        # Keep-alive connection pool shared by all transcriptions
+        self._session = requests.Session()
+        self._session.headers['Authorization'] = f"Bearer {self.api_key}"
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            # The upload is billed and not idempotent: only failures to connect, where
+            # nothing reached the server, are retried, and only briefly
+            max_retries=Retry(
+                total=2,
+                connect=2,
+                read=0,
+                status=0,
+                backoff_factor=0.2,
+                allowed_methods=frozenset({'POST'})
+            )
+        )
+        self._session.mount('https://', adapter)
+        
+        # Compress uploads to Opus when the encoder is available; pass
+        # use_opus=False to keep lossless WAV uploads
+        self.use_opus = use_opus and OPUS_AVAILABLE
+        
+        # Content hash -> result dict, least recently used first
+        self._cache: 'OrderedDict[bytes, Dict[str, Any]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
     
-    def transcribe_audio_data(self, audio_data: list, sample_rate: int = 16000) -> Dict[str, Any]:
-        """Transcribe audio data using OpenAI Whisper API"""
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result for a content hash, or None"""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return dict(result)
+    
+    def _cache_put(self, key: bytes, result: Dict[str, Any]):
+        """Remember a successful result, evicting the least recently used"""
+        if not result['success']:
+            return
+        with self._cache_lock:
+            self._cache[key] = dict(result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counters and current size of the result cache"""
+        with self._cache_lock:
+            return {
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'size': len(self._cache),
+                'maxsize': RESULT_CACHE_SIZE
+            }
+    
+    def _to_int16_bytes(self, audio_data: np.ndarray, scale: float = 32767.0) -> bytes:
+        """Encode float samples times scale as 16-bit PCM through pooled scratch buffers"""
+        n = len(audio_data)
+        scratch = _F32_POOL.acquire(n)
+        pcm = _I16_POOL.acquire(n)
         try:
-            # Convert to numpy array if not already
-            if not isinstance(audio_data, np.ndarray):
-                audio_data = np.array(audio_data)
+            np.multiply(audio_data, scale, out=scratch)
+            np.rint(scratch, out=scratch)
+            # Clip before the cast so nothing wraps around to -32768
+            np.clip(scratch, -32767, 32767, out=scratch)
+            np.copyto(pcm, scratch, casting='unsafe')
+            return pcm.tobytes()
+        finally:
+            _F32_POOL.release(scratch)
+            _I16_POOL.release(pcm)
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._session.close()
+    
+    def transcribe_audio_data(self, audio_data: np.ndarray, sample_rate: int = 16000,
+                              prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Transcribe audio data using OpenAI Whisper API; prompt is preceding text for context.
+
+        int16 input is sent as PCM unchanged; float input is peak-normalized.
+        """
+        if isinstance(audio_data, np.ndarray) and audio_data.dtype == np.int16:
+            return self.transcribe_pcm16(audio_data, sample_rate, prompt)
+        try:
+            # float32 throughout; no copy when the caller already passes float32
+            audio_data = np.asarray(audio_data, dtype=np.float32)
             
-            # Normalize audio
+            # Peak normalization is folded into the int16 scale, so the samples
+            # are only rewritten once
+            scale = 32767.0
             if len(audio_data) > 0:
-                max_val = np.max(np.abs(audio_data))
+                max_val = _peak_abs(audio_data)
                 if max_val > 0:
-                    audio_data = audio_data / max_val
+                    scale = 32767.0 / max_val
             
-            # Create temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_filename = temp_file.name
-                
-                # Write WAV file
-                with wave.open(temp_filename, 'wb') as wav_file:
-                    wav_file.setnchannels(1)  # Mono
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(sample_rate)
-                    
-                    # Convert float32 to int16
-                    audio_int16 = (audio_data * 32767).astype(np.int16)
-                    wav_file.writeframes(audio_int16.tobytes())
-                
-                # Transcribe using OpenAI API
-                result = self._transcribe_file(temp_filename)
-                
-                # Clean up temp file
-                os.unlink(temp_filename)
-                
-                return result
+            pcm = self._to_int16_bytes(audio_data, scale)
+            
+            # Transcribe using OpenAI API
+            return self._transcribe_cached(pcm, sample_rate, prompt)
                 
         except Exception as e:
             return {
@@ -60,6 +212,37 @@ class TranscriptionService:
                 'text': ''
             }
     
+    def transcribe_pcm16(self, pcm: np.ndarray, sample_rate: int = 16000,
+                         prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Transcribe 16-bit mono PCM as-is, with no float conversion or normalization"""
+        try:
+            pcm_bytes = np.ascontiguousarray(pcm, dtype='<i2').tobytes()
+            return self._transcribe_cached(pcm_bytes, sample_rate, prompt)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'text': ''
+            }
+    
+    def _transcribe_cached(self, pcm: bytes, sample_rate: int, prompt: Optional[str]) -> Dict[str, Any]:
+        """Transcribe PCM bytes, answering repeats from the result cache"""
+        if prompt:
+            # Live chunks carry the previous text as a prompt and never repeat, so
+            # hashing them would only evict entries that can
+            return self._transcribe_pcm(pcm, sample_rate, prompt)
+        
+        key_hash = hashlib.blake2b(pcm, digest_size=16)
+        key_hash.update(f"|{sample_rate}".encode('utf-8'))
+        key = key_hash.digest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._transcribe_pcm(pcm, sample_rate, prompt)
+        self._cache_put(key, result)
+        return result
+    
     def transcribe_file(self, file_path: str) -> Dict[str, Any]:
         """Transcribe audio file using OpenAI Whisper API"""
         try:
@@ -72,8 +255,79 @@ class TranscriptionService:
                 'text': ''
             }
     
-    def _transcribe_file(self, audio_file_path: str) -> Dict[str, Any]:
+    def transcribe_fileobj(self, fileobj, filename: str) -> Dict[str, Any]:
+        """Transcribe an open binary audio file; filename's extension tells Whisper the format"""
+        try:
+            return self._transcribe_fileobj(fileobj, filename)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'text': ''
+            }
+    
+    def _transcribe_file(self, audio_file_path: str, prompt: Optional[str] = None) -> Dict[str, Any]:
         """Internal method to transcribe audio file"""
+        with open(audio_file_path, 'rb') as audio_file:
+            return self._transcribe_fileobj(audio_file, audio_file_path, prompt)
+    
+    def _transcribe_fileobj(self, fileobj, filename: str, prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Transcribe a file-like object from its start, answering repeats from the result cache"""
+        fileobj.seek(0)
+        key_hash = hashlib.blake2b(digest_size=16)
+        for block in iter(lambda: fileobj.read(1 << 20), b''):
+            key_hash.update(block)
+        key_hash.update(f"|file|{prompt or ''}".encode('utf-8'))
+        key = key_hash.digest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        fileobj.seek(0)
+        result = self._transcribe_stream(fileobj, filename, prompt)
+        self._cache_put(key, result)
+        return result
+    
+    def _transcribe_stream(self, fileobj, filename: str, prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Upload audio from a file-like object to the Whisper API"""
+        files = {
+            'file': (filename, fileobj, 'audio/wav')
+        }
+        data = {**_WHISPER_FIELDS, 'prompt': prompt} if prompt else _WHISPER_FIELDS
+        return self._post_transcription(files=files, data=data)
+    
+    def _encode_opus(self, pcm: bytes, sample_rate: int) -> Optional[bytes]:
+        """Encode 16-bit mono PCM as Ogg/Opus, or None if this clip failed to encode"""
+        buffer = io.BytesIO()
+        try:
+            sf.write(buffer, np.frombuffer(pcm, dtype='<i2'), sample_rate,
+                     format='OGG', subtype='OPUS')
+        except Exception as e:
+            log.warning("Opus encoding failed, uploading WAV: %s", e)
+            return None
+        return buffer.getvalue()
+    
+    def _transcribe_pcm(self, pcm: bytes, sample_rate: int, prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Upload 16-bit mono PCM as Opus (or WAV), assembling the multipart body in one copy"""
+        opus = None
+        if self.use_opus and sample_rate in OPUS_SAMPLE_RATES:
+            opus = self._encode_opus(pcm, sample_rate)
+        
+        if opus is not None:
+            file_parts = (_FORM_OGG_HEAD, opus)
+        else:
+            file_parts = (_FORM_FILE_HEAD, _wav_header(len(pcm) // 2, sample_rate), pcm)
+        
+        body = b''.join((
+            _FORM_FIELDS,
+            _form_field('prompt', prompt) if prompt else b'',
+            *file_parts,
+            _FORM_TAIL
+        ))
+        return self._post_transcription(data=body, headers={'Content-Type': _FORM_CONTENT_TYPE})
+    
+    def _post_transcription(self, **request_args) -> Dict[str, Any]:
+        """POST a transcription request and unpack the Whisper response"""
         try:
             if not self.api_key:
                 return {
@@ -82,40 +336,23 @@ class TranscriptionService:
                     'text': ''
                 }
             
-            # Prepare the request
-            url = "https://api.openai.com/v1/audio/transcriptions"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}"
-            }
+            # Make the request
+            response = self._session.post(WHISPER_URL, timeout=(5, 30), **request_args)
             
-            # Read the audio file
-            with open(audio_file_path, 'rb') as audio_file:
-                files = {
-                    'file': (audio_file_path, audio_file, 'audio/wav')
+            if response.status_code == 200:
+                result = loads_json(response.content)
+                return {
+                    'success': True,
+                    'text': result.get('text', ''),
+                    'error': None
                 }
-                data = {
-                    'model': 'whisper-1',
-                    'language': 'de',  # German
-                    'response_format': 'json'
+            else:
+                return {
+                    'success': False,
+                    'error': f"API error: {response.status_code} - {response.text}",
+                    'text': ''
                 }
                 
-                # Make the request
-                response = requests.post(url, headers=headers, files=files, data=data, timeout=30)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return {
-                        'success': True,
-                        'text': result.get('text', ''),
-                        'error': None
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': f"API error: {response.status_code} - {response.text}",
-                        'text': ''
-                    }
-                    
         except Exception as e:
             return {
                 'success': False,
@@ -126,20 +363,17 @@ class TranscriptionService:
     def process_transcription(self, text: str) -> Dict[str, Any]:
         """Process transcription text and extract sentences"""
         try:
-            # Simple sentence detection
+            # Simple sentence detection; matches are contiguous from the start of the text
             sentences = []
-            current = ""
-            
-            for char in text:
-                current += char
-                if char in '.!?':
-                    sentence = current.strip()
-                    if sentence and len(sentence) > 1:
-                        sentences.append(sentence)
-                    current = ""
+            end = 0
+            for match in _SENTENCE_RE.finditer(text):
+                sentence = match.group().strip()
+                if len(sentence) > 1:
+                    sentences.append(sentence)
+                end = match.end()
             
             # Handle remaining text
-            remaining = current.strip()
+            remaining = text[end:].strip()
             
             return {
                 'success': True,
@@ -8,7 +8,7 @@ class PodcastTranscriber {
     this.isRecording = false;
     this.transcriptions = [];
     this.currentSentence = "";
-    this.pollInterval = null;
+    this.eventSource = null;
 
     this.initializeElements();
     this.bindEvents();
@@ -67,7 +67,7 @@ class PodcastTranscriber {
       if (result.success) {
         this.isRecording = true;
         this.updateUI();
-        this.startPolling();
+        this.startStreaming();
         this.hideLoading();
       } else {
         throw new Error(result.error || "Failed to start recording");
@@ -97,7 +97,7 @@ class PodcastTranscriber {
 
       if (result.success) {
         this.isRecording = false;
-        this.stopPolling();
+        this.stopStreaming();
         this.updateUI();
         this.hideLoading();
       } else {
@@ -110,47 +110,33 @@ class PodcastTranscriber {
     }
   }
 
-  startPolling() {
-    this.pollInterval = setInterval(() => {
-      this.pollTranscriptions();
-    }, 1000); // Poll every second
+  startStreaming() {
+    this.stopStreaming();
+    this.eventSource = new EventSource(`/api/stream/${this.sessionId}`);
+    this.eventSource.onmessage = (event) => {
+      this.handleStreamMessage(JSON.parse(event.data));
+    };
+    this.eventSource.onerror = (error) => {
+      console.error("Transcription stream error:", error);
+    };
   }
 
-  stopPolling() {
-    if (this.pollInterval) {
-      clearInterval(this.pollInterval);
-      this.pollInterval = null;
+  stopStreaming() {
+    if (this.eventSource) {
+      this.eventSource.close();
+      this.eventSource = null;
     }
   }
 
-  async pollTranscriptions() {
-    try {
-      const response = await fetch(`/api/transcriptions/${this.sessionId}`);
-      const result = await response.json();
-
-      if (result.success) {
-        this.updateTranscriptions(
-          result.transcriptions,
-          result.current_sentence
-        );
-      }
-    } catch (error) {
-      console.error("Error polling transcriptions:", error);
-    }
-  }
-
-  updateTranscriptions(transcriptions, currentSentence) {
-    // Update transcriptions if they've changed
-    if (
-      JSON.stringify(transcriptions) !== JSON.stringify(this.transcriptions)
-    ) {
-      this.transcriptions = transcriptions;
+  handleStreamMessage(message) {
+    if (message.complete) {
+      // Completed sentences replace the in-progress one
+      this.transcriptions = this.transcriptions.concat([message]);
+      this.currentSentence = "";
       this.renderTranscriptions();
-    }
-
-    // Update current sentence if it's changed
-    if (currentSentence !== this.currentSentence) {
-      this.currentSentence = currentSentence;
+      this.renderCurrentSentence();
+    } else if (message.text !== this.currentSentence) {
+      this.currentSentence = message.text;
       this.renderCurrentSentence();
     }
   }